@@ -1,6 +1,8 @@
 import streamlit as st
 from datetime import datetime
-from utils.data_loader import get_data
+import os
+from utils.data_loader import get_data, get_archive_data
+from utils.price_store import DEFAULT_ARCHIVE_PATH, MANIFEST_FILE
 # We import our new specialized app modules
 from quant_a.app import render_quant_a
 from quant_b.app import render_quant_b
@@ -21,9 +23,18 @@ def main():
     st.sidebar.divider()
     st.sidebar.subheader("⚙️ Settings")
     tickers = st.sidebar.text_input("Universe Tickers", ", ".join(ASSET_MAP.keys()))
-    period = st.sidebar.selectbox("Horizon", ["1y", "2y", "5y"], index=0)
+    horizons = ["1y", "2y", "5y"]
+    if os.path.exists(os.path.join(DEFAULT_ARCHIVE_PATH, MANIFEST_FILE)):
+        horizons.append("Archive (full history)")
+    period = st.sidebar.selectbox("Horizon", horizons, index=0)
     
-    df = get_data(tickers, period)
+    if period == "Archive (full history)":
+        df = get_archive_data(tickers)
+        missing = {t.strip().upper() for t in tickers.split(',') if t.strip()} - set(df.columns)
+        if missing:
+            st.sidebar.warning(f"Not in the archive: {', '.join(sorted(missing))}")
+    else:
+        df = get_data(tickers, period)
 
     if menu == "🏠 Overview":
         st.title("Executive Dashboard")
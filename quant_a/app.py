@@ -2,6 +2,7 @@ import streamlit as st
 import plotly.graph_objects as go
 from quant_a.strategies import run_ma_crossover_strategy, run_bollinger_strategy, get_performance_metrics
 from quant_a.strategies import run_ai_strategy
+from utils.feature_store import get_feature_store
 
 def render_quant_a(df, asset_names_map):
     st.header("Single Asset Predictive Research")
@@ -38,20 +39,21 @@ def render_quant_a(df, asset_names_map):
     with col_params:
         # Prepare single asset data
         asset_df = df[[selected_ticker]].rename(columns={selected_ticker: 'Close'})
+        store = get_feature_store()
         
         if strategy_type == "MA Crossover":
             s_win = st.slider("Short Window", 5, 50, 20)
             l_win = st.slider("Long Window", 51, 200, 100)
-            results = run_ma_crossover_strategy(asset_df, s_win, l_win)
+            results = run_ma_crossover_strategy(asset_df, s_win, l_win, store=store, ticker=selected_ticker)
         
         elif strategy_type == "Bollinger Mean-Reversion":
             win = st.slider("Window", 10, 50, 20)
             std_dev = st.slider("Std Dev", 1.0, 3.0, 2.0, 0.5)
-            results = run_bollinger_strategy(asset_df, win, std_dev)
+            results = run_bollinger_strategy(asset_df, win, std_dev, store=store, ticker=selected_ticker)
             
         elif strategy_type == "AI Ensemble Strategy":
             threshold = st.slider("AI Confidence Threshold", 0.50, 0.70, 0.55, 0.01)
-            results = run_ai_strategy(df, selected_asset=selected_ticker, threshold=threshold)
+            results = run_ai_strategy(df, selected_asset=selected_ticker, threshold=threshold, store=store)
             
         else: # Buy & Hold
             results = run_ma_crossover_strategy(asset_df, 1, 2)
@@ -62,7 +64,7 @@ def render_quant_a(df, asset_names_map):
     metrics = get_performance_metrics(results['Cumulative_PNL'])
     m1, m2, m3, m4, m5 = st.columns(5)
     m1.metric("Total Return", f"{metrics['Total Return']:.2%}")
-    m2.metric("Ann. Volatility", f"{metrics['Annual Vol']:.2%}")
+    m2.metric("Ann. Volatility", f"{metrics['Annual Volatility']:.2%}")
     m3.metric("Sharpe Ratio", f"{metrics['Sharpe Ratio']:.2f}")
     m4.metric("Max Drawdown", f"{metrics['Max Drawdown']:.2%}")
     m5.metric("Hit Ratio", f"{metrics['Hit Ratio']:.2%}")
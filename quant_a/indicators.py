@@ -1,32 +1,32 @@
 import pandas as pd
-import numpy as np
+from utils.feature_store import load_feature
 
-def compute_technical_indicators(df, ticker):
+def compute_technical_indicators(df, ticker, store=None):
     # Create a copy to avoid modifying the original dataframe
     data = df[[ticker]].copy()
     data.columns = ['Close']
     
+    # Rolling features are served by the feature store when one is given
+    def feature(name, **params):
+        return load_feature(data['Close'], name, store, ticker, **params)
+    
     # Trend Indicators: Moving Averages and Distance from Trend
-    data['MA20'] = data['Close'].rolling(window=20).mean()
-    data['MA50'] = data['Close'].rolling(window=50).mean()
+    data['MA20'] = feature('sma', window=20)
+    data['MA50'] = feature('sma', window=50)
     data['Dist_MA20'] = (data['Close'] - data['MA20']) / data['MA20']
     
     # Momentum Indicator: Relative Strength Index (RSI)
-    delta = data['Close'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-    rs = gain / loss
-    data['RSI'] = 100 - (100 / (1 + rs))
+    data['RSI'] = feature('rsi', window=14)
     
     # Volatility Indicator: Bollinger Bands
-    data['Std_Dev'] = data['Close'].rolling(window=20).std()
+    data['Std_Dev'] = feature('rolling_std', window=20)
     data['Upper_Band'] = data['MA20'] + (data['Std_Dev'] * 2)
     data['Lower_Band'] = data['MA20'] - (data['Std_Dev'] * 2)
     data['BB_Width'] = (data['Upper_Band'] - data['Lower_Band']) / data['MA20']
     
     # Performance Indicator: Historical Volatility (Annualized)
-    data['Log_Ret'] = np.log(data['Close'] / data['Close'].shift(1))
-    data['Hist_Vol'] = data['Log_Ret'].rolling(window=21).std() * np.sqrt(252)
+    data['Log_Ret'] = feature('log_return')
+    data['Hist_Vol'] = feature('hist_vol', window=21)
     
     # Target Variable: 1 if next day return is positive, 0 otherwise
     # We use a shift of -1 to align today's features with tomorrow's outcome
@@ -1,3 +1,6 @@
+import os
+import json
+from urllib.parse import quote
 import numpy as np
 import pandas as pd
 from sklearn.ensemble import RandomForestClassifier, VotingClassifier
@@ -6,24 +9,63 @@ from sklearn.model_selection import TimeSeriesSplit
 from xgboost import XGBClassifier
 from quant_a.indicators import compute_technical_indicators
 
-def train_predict_ensemble(df, ticker):
-    data = compute_technical_indicators(df, ticker)
+FEATURE_COLUMNS = ['Dist_MA20', 'RSI', 'BB_Width', 'Hist_Vol']
+TUNING_PATH = os.path.join("data", "tuning")
+# Share of the history used for training; the rest is the out-of-sample backtest
+TRAIN_FRACTION = 0.7
+
+# Baseline hyperparameters (used until a ticker has been tuned)
+DEFAULT_PARAMS = {
+    'rf_n_estimators': 100, 'rf_max_depth': 5, 'rf_min_samples_leaf': 1,
+    'xgb_n_estimators': 100, 'xgb_learning_rate': 0.05, 'xgb_max_depth': 3, 'xgb_subsample': 1.0,
+    'lr_C': 1.0,
+    'weights': [1, 1, 1]
+}
+
+def build_ensemble(params=None, n_jobs=None):
+    """Soft-voting ensemble (RF + XGBoost + Logistic Regression) from a flat parameter dict."""
+    p = {**DEFAULT_PARAMS, **(params or {})}
+    return VotingClassifier(
+        estimators=[
+            ('rf', RandomForestClassifier(n_estimators=p['rf_n_estimators'], max_depth=p['rf_max_depth'],
+                                          min_samples_leaf=p['rf_min_samples_leaf'], random_state=42, n_jobs=n_jobs)),
+            ('xgb', XGBClassifier(n_estimators=p['xgb_n_estimators'], learning_rate=p['xgb_learning_rate'],
+                                  max_depth=p['xgb_max_depth'], subsample=p['xgb_subsample'],
+                                  tree_method='hist', n_jobs=n_jobs, eval_metric='logloss')),
+            ('lr', LogisticRegression(C=p['lr_C']))
+        ],
+        voting='soft',
+        weights=p['weights']
+    )
+
+def load_tuned_params(ticker, path=TUNING_PATH, before=None):
+    """
+    Returns the persisted tuning result for a ticker, or the baseline parameters.
+    With `before`, tuned parameters are only used if they were selected on data
+    ending strictly before that timestamp (no look-ahead into a test segment).
+    """
+    file_path = os.path.join(path, f"{quote(str(ticker), safe='')}.json")
+    if not os.path.exists(file_path):
+        return dict(DEFAULT_PARAMS)
+    with open(file_path) as f:
+        result = json.load(f)
+    if before is not None:
+        train_end = result.get('train_end')
+        if train_end is None or pd.Timestamp(train_end) >= pd.Timestamp(before):
+            return dict(DEFAULT_PARAMS)
+    return {**DEFAULT_PARAMS, **result['params']}
+
+def train_predict_ensemble(df, ticker, store=None, params=None):
+    data = compute_technical_indicators(df, ticker, store)
     
     # Matching features from indicators.py
-    features = ['Dist_MA20', 'RSI', 'BB_Width', 'Hist_Vol']
-    X = data[features]
+    X = data[FEATURE_COLUMNS]
     y = data['Target']
     
     tscv = TimeSeriesSplit(n_splits=5)
     
-    rf = RandomForestClassifier(n_estimators=100, max_depth=5, random_state=42)
-    xgb = XGBClassifier(n_estimators=100, learning_rate=0.05, max_depth=3, eval_metric='logloss')
-    lr = LogisticRegression()
-    
-    ensemble = VotingClassifier(
-        estimators=[('rf', rf), ('xgb', xgb), ('lr', lr)],
-        voting='soft'
-    )
+    # Tuned hyperparameters are reused when available (see quant_a.tuning)
+    ensemble = build_ensemble(params if params is not None else load_tuned_params(ticker))
     
     # Walking-forward training
     for train_index, test_index in tscv.split(X):
@@ -36,24 +78,18 @@ def train_predict_ensemble(df, ticker):
     
     return prediction_prob, ensemble
 
-def get_ensemble_signals(df, ticker):
-    data = compute_technical_indicators(df, ticker)
-    features = ['Dist_MA20', 'RSI', 'BB_Width', 'Hist_Vol']
-    X = data[features]
+def get_ensemble_signals(df, ticker, store=None, params=None):
+    data = compute_technical_indicators(df, ticker, store)
+    X = data[FEATURE_COLUMNS]
     
-    split = int(0.7 * len(data))
+    split = int(TRAIN_FRACTION * len(data))
     X_train, X_test = X.iloc[:split], X.iloc[split:]
     y_train = data['Target'].iloc[:split]
     
-    ensemble = VotingClassifier(
-        estimators=[
-            ('rf', RandomForestClassifier(n_estimators=100, max_depth=5, random_state=42)),
-            ('xgb', XGBClassifier(n_estimators=100, learning_rate=0.05, max_depth=3, eval_metric='logloss')),
-            ('lr', LogisticRegression())
-        ],
-        voting='soft'
-    )
-    
+    # Tuned parameters only count if they were chosen before the test segment starts
+    if params is None:
+        params = load_tuned_params(ticker, before=data.index[split]) if split < len(data) else DEFAULT_PARAMS
+    ensemble = build_ensemble(params)
     ensemble.fit(X_train, y_train)
     test_signals = ensemble.predict_proba(X_test)[:, 1]
     
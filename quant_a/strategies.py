@@ -1,14 +1,16 @@
 import pandas as pd
 import numpy as np
 from quant_a.prediction import get_ensemble_signals
+from utils.feature_store import load_feature
+from utils.metrics import compute_metrics_from_equity, RISK_FREE_RATE, TRADING_DAYS
 
-def run_ai_strategy(df, selected_asset, threshold=0.5):
+def run_ai_strategy(df, selected_asset, threshold=0.5, store=None):
     """
     Executes the Ensemble AI strategy.
     Connects the prediction engine to the backtesting logic.
     """
     # Retrieve price data and AI probabilities from prediction.py
-    price_data, signals = get_ensemble_signals(df, selected_asset)
+    price_data, signals = get_ensemble_signals(df, selected_asset, store=store)
     
     results = pd.DataFrame(index=price_data.index)
     results['Close'] = price_data
@@ -23,14 +25,15 @@ def run_ai_strategy(df, selected_asset, threshold=0.5):
     
     return results
 
-def run_ma_crossover_strategy(df, short_window, long_window):
+def run_ma_crossover_strategy(df, short_window, long_window, store=None, ticker=None):
     """Standard Moving Average Crossover (Momentum)"""
     data = df.copy()
     if 'Close' not in data.columns and len(data.columns) == 1:
+        ticker = ticker or data.columns[0]
         data.columns = ['Close']
         
-    data['Short_MA'] = data['Close'].rolling(window=short_window).mean()
-    data['Long_MA'] = data['Close'].rolling(window=long_window).mean()
+    data['Short_MA'] = load_feature(data['Close'], 'sma', store, ticker, window=short_window)
+    data['Long_MA'] = load_feature(data['Close'], 'sma', store, ticker, window=long_window)
     data['Signal'] = np.where(data['Short_MA'] > data['Long_MA'], 1.0, -1.0)
     
     data['Strategy_Returns'] = data['Signal'].shift(1) * data['Close'].pct_change()
@@ -38,14 +41,15 @@ def run_ma_crossover_strategy(df, short_window, long_window):
     data['Benchmark_PNL'] = (1 + data['Close'].pct_change().fillna(0)).cumprod()
     return data
 
-def run_bollinger_strategy(df, window, num_std):
+def run_bollinger_strategy(df, window, num_std, store=None, ticker=None):
     """Bollinger Bands Strategy (Mean-Reversion)"""
     data = df.copy()
     if 'Close' not in data.columns and len(data.columns) == 1:
+        ticker = ticker or data.columns[0]
         data.columns = ['Close']
 
-    data['MA'] = data['Close'].rolling(window=window).mean()
-    data['STD'] = data['Close'].rolling(window=window).std()
+    data['MA'] = load_feature(data['Close'], 'sma', store, ticker, window=window)
+    data['STD'] = load_feature(data['Close'], 'rolling_std', store, ticker, window=window)
     data['Upper'] = data['MA'] + (num_std * data['STD'])
     data['Lower'] = data['MA'] - (num_std * data['STD'])
     
@@ -57,20 +61,48 @@ def run_bollinger_strategy(df, window, num_std):
     data['Benchmark_PNL'] = (1 + data['Close'].pct_change().fillna(0)).cumprod()
     return data
 
-def get_performance_metrics(cumulative_series):
+def run_strategy_out_of_core(chunks, strategy_fn, lookback, **params):
+    """
+    Streams a single-asset strategy over chronological price chunks.
+    Bars without a close (e.g. weekends of an archive shared with crypto) are
+    dropped, as `dropna()` does in memory. The last `lookback` valid closes are
+    carried into the next chunk so rolling windows are warm, and equity curves
+    are chained from the previous chunk's final value. Yields one result frame
+    per chunk, identical to the corresponding rows of the in-memory backtest.
+    """
+    tail = None
+    last_pnl, last_bench = 1.0, 1.0
+
+    for chunk in chunks:
+        chunk = chunk.dropna()
+        if chunk.empty:
+            continue
+        data = chunk if tail is None else pd.concat([tail, chunk])
+        full = strategy_fn(data, **params)
+        new_rows = slice(len(data) - len(chunk), None)
+
+        # Re-chain the equity curves: cumprod seeded with the carried value
+        strat_growth = (1 + full['Strategy_Returns'].fillna(0)).to_numpy()[new_rows]
+        bench_growth = (1 + full['Close'].pct_change().fillna(0)).to_numpy()[new_rows]
+        results = full.iloc[new_rows].copy()
+        results['Cumulative_PNL'] = np.cumprod(np.concatenate(([last_pnl], strat_growth)))[1:]
+        results['Benchmark_PNL'] = np.cumprod(np.concatenate(([last_bench], bench_growth)))[1:]
+
+        last_pnl = results['Cumulative_PNL'].iloc[-1]
+        last_bench = results['Benchmark_PNL'].iloc[-1]
+        tail = data.iloc[-lookback:]
+        yield results
+
+def run_ma_crossover_out_of_core(chunks, short_window, long_window):
+    """Out-of-core MA Crossover over a stream of single-asset price chunks."""
+    return run_strategy_out_of_core(chunks, run_ma_crossover_strategy, max(short_window, long_window),
+                                    short_window=short_window, long_window=long_window)
+
+def run_bollinger_out_of_core(chunks, window, num_std):
+    """Out-of-core Bollinger Mean-Reversion over a stream of single-asset price chunks."""
+    return run_strategy_out_of_core(chunks, run_bollinger_strategy, window,
+                                    window=window, num_std=num_std)
+
+def get_performance_metrics(cumulative_series, risk_free_rate=RISK_FREE_RATE, periods_per_year=TRADING_DAYS):
     """Institutional Grade Risk/Return Metrics"""
-    returns = cumulative_series.pct_change().dropna()
-    total_return = cumulative_series.iloc[-1] - 1
-    ann_vol = returns.std() * np.sqrt(252)
-    sharpe = (returns.mean() * 252 - 0.02) / ann_vol if ann_vol != 0 else 0
-    peak = cumulative_series.cummax()
-    max_dd = ((cumulative_series - peak) / peak).min()
-    hit_ratio = len(returns[returns > 0]) / len(returns) if len(returns) > 0 else 0
-    
-    return {
-        "Total Return": total_return,
-        "Annual Vol": ann_vol,
-        "Sharpe Ratio": sharpe,
-        "Max Drawdown": max_dd,
-        "Hit Ratio": hit_ratio
-    }
\ No newline at end of file
+    return compute_metrics_from_equity(cumulative_series, risk_free_rate, periods_per_year).iloc[0].to_dict()
@@ -0,0 +1,125 @@
+import os
+import json
+import math
+from datetime import datetime
+from urllib.parse import quote
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from sklearn.metrics import log_loss
+from sklearn.model_selection import TimeSeriesSplit
+from quant_a.indicators import compute_technical_indicators
+from quant_a.prediction import FEATURE_COLUMNS, TUNING_PATH, TRAIN_FRACTION, DEFAULT_PARAMS, build_ensemble
+
+VOTING_WEIGHTS = [[1, 1, 1], [2, 1, 1], [1, 2, 1], [1, 1, 2], [2, 2, 1], [1, 2, 2], [2, 1, 2]]
+
+_FOLD_DATA = None
+
+def sample_params(rng):
+    """Draws one candidate from the ensemble search space."""
+    return {
+        'rf_n_estimators': int(rng.choice([50, 100, 200, 300])),
+        'rf_max_depth': int(rng.choice([3, 5, 8, 12])),
+        'rf_min_samples_leaf': int(rng.choice([1, 5, 20])),
+        'xgb_n_estimators': int(rng.choice([50, 100, 200, 400])),
+        'xgb_learning_rate': float(np.exp(rng.uniform(np.log(0.01), np.log(0.3)))),
+        'xgb_max_depth': int(rng.choice([2, 3, 4, 6])),
+        'xgb_subsample': float(rng.uniform(0.6, 1.0)),
+        'lr_C': float(np.exp(rng.uniform(np.log(0.01), np.log(10.0)))),
+        'weights': VOTING_WEIGHTS[rng.integers(len(VOTING_WEIGHTS))]
+    }
+
+def _prepare_folds(df, ticker, n_splits, train_fraction=TRAIN_FRACTION, store=None):
+    """
+    Features and TimeSeriesSplit folds are built once and shared by every trial.
+    Only the training share of the history is used, the same split as the
+    backtest in `get_ensemble_signals`, so its test bars never influence tuning.
+    """
+    data = compute_technical_indicators(df, ticker, store)
+    data = data.iloc[:int(train_fraction * len(data))]
+    X = data[FEATURE_COLUMNS].to_numpy(dtype=np.float64)
+    y = data['Target'].to_numpy()
+    folds = list(TimeSeriesSplit(n_splits=n_splits).split(X))
+    return {'X': X, 'y': y, 'folds': folds, 'index': data.index}
+
+def _init_worker(fold_data):
+    global _FOLD_DATA
+    _FOLD_DATA = fold_data
+
+def _score_fold(task):
+    """Log loss of one candidate on one walk-forward fold (lower is better)."""
+    params, fold, threads = task
+    X, y = _FOLD_DATA['X'], _FOLD_DATA['y']
+    train_index, test_index = _FOLD_DATA['folds'][fold]
+    model = build_ensemble(params, n_jobs=threads)
+    model.fit(X[train_index], y[train_index])
+    return log_loss(y[test_index], model.predict_proba(X[test_index])[:, 1], labels=[0, 1])
+
+def _rung_budgets(n_splits, eta):
+    """Number of folds evaluated at each successive-halving rung, e.g. [1, 2, 5]."""
+    budgets = [n_splits]
+    while budgets[-1] > 1:
+        budgets.append(math.ceil(budgets[-1] / eta))
+    return sorted(set(budgets))
+
+def tune_ensemble(df, ticker, n_candidates=27, n_splits=5, eta=3, n_jobs=None, threads_per_worker=1,
+                  random_state=0, train_fraction=TRAIN_FRACTION, store=None, save=True, path=TUNING_PATH):
+    """
+    Successive-halving random search over the ensemble hyperparameters and voting weights.
+    Every candidate starts on the earliest walk-forward fold; only the best 1/eta move on
+    to the next rung and its additional folds. Fold scores are cached across rungs, trials
+    run on a process pool (n_jobs workers x threads_per_worker XGBoost/RF threads), and the
+    winner is persisted for `load_tuned_params` together with the date range it was tuned on.
+    """
+    rng = np.random.default_rng(random_state)
+    candidates = [dict(DEFAULT_PARAMS)] + [sample_params(rng) for _ in range(n_candidates - 1)]
+    fold_data = _prepare_folds(df, ticker, n_splits, train_fraction, store)
+    train_index = fold_data.pop('index')
+    scores = {i: [] for i in range(len(candidates))}
+    alive = list(scores)
+
+    pool = None
+    if n_jobs != 1:
+        pool = ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker, initargs=(fold_data,))
+    else:
+        _init_worker(fold_data)
+
+    try:
+        for budget in _rung_budgets(n_splits, eta):
+            tasks = [(i, fold) for i in alive for fold in range(len(scores[i]), budget)]
+            payload = [(candidates[i], fold, threads_per_worker) for i, fold in tasks]
+            results = pool.map(_score_fold, payload) if pool else map(_score_fold, payload)
+            for (i, _), loss in zip(tasks, results):
+                scores[i].append(loss)
+
+            # Prune: keep the best 1/eta candidates for the next rung
+            alive.sort(key=lambda i: np.mean(scores[i]))
+            if budget < n_splits:
+                alive = alive[:max(1, len(alive) // eta)]
+    finally:
+        if pool:
+            pool.shutdown()
+
+    best = alive[0]
+    result = {
+        'ticker': ticker,
+        'params': candidates[best],
+        'cv_log_loss': float(np.mean(scores[best])),
+        'baseline_log_loss': float(np.mean(scores[0])) if len(scores[0]) == n_splits else None,
+        'n_candidates': len(candidates),
+        'n_fits': sum(len(s) for s in scores.values()),
+        'train_start': train_index[0].isoformat(),
+        'train_end': train_index[-1].isoformat(),
+        'tuned_at': datetime.now().isoformat(timespec='seconds')
+    }
+    if save:
+        save_tuning_result(result, path)
+    return result
+
+def save_tuning_result(result, path=TUNING_PATH):
+    os.makedirs(path, exist_ok=True)
+    with open(os.path.join(path, f"{quote(str(result['ticker']), safe='')}.json"), "w") as f:
+        json.dump(result, f, indent=2)
+
+def tune_universe(df, tickers=None, **kwargs):
+    """Tunes every ticker of the universe in turn (overnight batch)."""
+    return {ticker: tune_ensemble(df, ticker, **kwargs) for ticker in (tickers or df.columns)}
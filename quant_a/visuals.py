@@ -36,6 +36,6 @@ def display_ai_metrics(metrics):
     c1, c2, c3, c4 = st.columns(4)
     
     c1.metric("Total Return", f"{metrics['Total Return']:.2%}")
-    c2.metric("Ann. Volatility", f"{metrics['Annual Vol']:.2%}")
+    c2.metric("Ann. Volatility", f"{metrics['Annual Volatility']:.2%}")
     c3.metric("Sharpe Ratio", f"{metrics['Sharpe Ratio']:.2f}")
     c4.metric("Max Drawdown", f"{metrics['Max Drawdown']:.2%}")
\ No newline at end of file
@@ -2,11 +2,43 @@ import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
+import numpy as np
 from quant_b.portfolio_manager import simulate_portfolio
 from quant_b.statistics import calculate_global_metrics
 from quant_b.visuals import plot_correlation_heatmap
 from quant_b.risk import calculate_risk_metrics
-from quant_b.optimization import optimize_portfolio
+from quant_b.optimization import optimize_portfolio, optimize_constrained, optimize_scenarios, ASSET_CLASSES
+from quant_b.live import LivePortfolio
+from quant_b.stress import StressTester
+from utils.data_loader import get_latest_bars
+
+LIVE_REFRESH_SECONDS = 60
+
+@st.fragment(run_every=LIVE_REFRESH_SECONDS)
+def render_live_monitor(df, weights):
+    """
+    Live panel: polls the latest bar and updates the cached portfolio state incrementally.
+    Only this fragment reruns on each tick; the rest of the page is untouched.
+    """
+    # Reseed whenever the page's history changes (horizon switch or data refresh)
+    live_key = (tuple(df.columns), tuple(weights), df.index[0], df.index[-1], len(df))
+    state = st.session_state.get("live_portfolio")
+    if state is None or st.session_state.get("live_key") != live_key:
+        state = LivePortfolio(df, weights)
+        st.session_state["live_portfolio"] = state
+        st.session_state["live_key"] = live_key
+
+    new_points = state.update(get_latest_bars(",".join(state.assets)))
+    metrics = state.metrics()
+
+    l1, l2, l3, l4 = st.columns(4)
+    l1.metric("Live Return", f"{metrics['Total Return']:.2%}", f"{new_points['Daily_Return'].iloc[-1]:.2%}" if not new_points.empty else None)
+    l2.metric("Rolling Vol (21D)", f"{metrics['Rolling Volatility']:.2%}")
+    l3.metric("Sharpe Ratio", f"{metrics['Sharpe Ratio']:.2f}")
+    l4.metric("Max Drawdown", f"{metrics['Max Drawdown']:.2%}")
+
+    st.line_chart(state.history['Cumulative'].tail(250), color="#00FFCC", height=250)
+    st.caption(f"Last bar: {state.last_time} · refreshed every {LIVE_REFRESH_SECONDS}s")
 
 def render_quant_b(df):
     st.header("Multivariate Portfolio Research & Optimization")
@@ -25,7 +57,9 @@ def render_quant_b(df):
         This module implements **Markowitz Mean-Variance Optimization**. 
         - **Objective**: Maximize the Sharpe Ratio (return per unit of risk).
         - **Efficient Frontier**: We use Monte Carlo simulations (5,000 iterations) to find the set of optimal portfolios.
+        - **Constrained Optimizer**: Exact SLSQP solves with asset-class caps, max weights, a turnover penalty and a volatility target.
         - **Risk Decomposition**: We analyze correlations to ensure diversification benefits are maximized.
+        - **Stress Testing**: Historical crisis windows and covariance-propagated factor shocks are replayed on buy-and-hold weights.
         """)
 
     # --- SECTION 1: ALLOCATION STRATEGY ---
@@ -34,9 +68,43 @@ def render_quant_b(df):
     
     col_mode, col_info = st.columns([1, 2])
     with col_mode:
-        mode = st.radio("Allocation Mode", ["Equal Weight", "Optimal Sharpe (Markowitz)"])
+        mode = st.radio("Allocation Mode", ["Equal Weight", "Optimal Sharpe (Markowitz)", "Constrained Optimizer"])
+
+    if mode == "Constrained Optimizer":
+        with col_info:
+            # Below 1/N the fully-invested constraint cannot be met
+            min_w = float(np.ceil(100 / num_assets) / 100)
+            max_w = st.slider("Max Weight per Asset", min_w, 1.0, max(0.30, min_w), 0.05)
+            classes = sorted({ASSET_CLASSES.get(a, "Other") for a in assets})
+            class_caps = st.columns(len(classes))
+            group_limits = {}
+            for col, asset_class in zip(class_caps, classes):
+                with col:
+                    group_limits[asset_class] = (0.0, st.number_input(f"Max {asset_class}", 0.0, 1.0, 1.0, 0.05))
+            target_vol = st.slider("Target Volatility (0 = none)", 0.0, 0.60, 0.0, 0.01)
+            turnover_penalty = st.slider("Turnover Penalty", 0.0, 0.10, 0.0, 0.005)
 
-    if mode == "Optimal Sharpe (Markowitz)":
+        constraints = dict(
+            max_weight=max_w, group_limits=group_limits,
+            asset_classes={a: ASSET_CLASSES.get(a, "Other") for a in assets},
+            current_weights=st.session_state.get("current_weights"),
+            turnover_penalty=turnover_penalty,
+            target_volatility=target_vol or None
+        )
+        opt_results = optimize_constrained(df, **constraints)
+        if opt_results['success']:
+            weights_dict = opt_results['weights']
+            st.success(f"Constrained optimum found (turnover {opt_results['turnover']:.2%}).")
+        else:
+            # Keep the previous allocation (or equal weights) rather than an infeasible solver iterate
+            previous = st.session_state.get("current_weights") or {}
+            if set(previous) == set(assets):
+                weights_dict = previous
+            else:
+                weights_dict = {asset: 1.0/num_assets for asset in assets}
+            st.error(f"Constraints are infeasible: {opt_results['message']}. Keeping the previous weights.")
+
+    elif mode == "Optimal Sharpe (Markowitz)":
         with st.spinner("Calculating Optimal Frontier..."):
             opt_results = optimize_portfolio(df)
             weights_dict = opt_results['weights']
@@ -55,6 +123,7 @@ def render_quant_b(df):
         
         if abs(sum(display_weights) - 1.0) > 0.01:
             st.warning(f"Total Allocation: {sum(display_weights):.2%}. Normalizing weights to 100%...")
+        st.session_state["current_weights"] = dict(zip(assets, display_weights))
 
     # --- SECTION 2: PERFORMANCE COMPARISON ---
     results = simulate_portfolio(df, display_weights)
@@ -98,6 +167,9 @@ def render_quant_b(df):
     )
     st.plotly_chart(fig_comp, use_container_width=True)
 
+    if st.toggle("🔴 Live Mode", help="Poll the latest bar and update the portfolio incrementally."):
+        render_live_monitor(df, display_weights)
+
     # --- SECTION 3: RISK & OPTIMIZATION VISUALS ---
     st.divider()
     col_risk, col_opt = st.columns(2)
@@ -130,5 +202,64 @@ def render_quant_b(df):
             ))
             fig_eff.update_layout(template="plotly_dark")
             st.plotly_chart(fig_eff, use_container_width=True)
+        elif mode == "Constrained Optimizer" and not opt_results['success']:
+            st.info("No constrained frontier: relax the constraints to find a feasible portfolio.")
+        elif mode == "Constrained Optimizer":
+            # Constrained frontier: one batched solve over a grid of volatility targets
+            vol_grid = np.linspace(opt_results['volatility'] * 0.5, opt_results['volatility'] * 1.5, 15)
+            frontier = optimize_scenarios(df, [{'target_volatility': v} for v in vol_grid], n_jobs=1,
+                                          **{**constraints, 'objective': 'max_return'})
+            frontier = [r for r in frontier if r['success']]
+            fig_eff = px.line(
+                x=[r['volatility'] for r in frontier], y=[r['return'] for r in frontier],
+                labels={'x': 'Volatility', 'y': 'Return'}, markers=True
+            )
+            fig_eff.add_trace(go.Scatter(
+                x=[opt_results['volatility']], y=[opt_results['return']],
+                mode='markers', marker=dict(color='red', size=15, symbol='star'),
+                name='Constrained Optimum'
+            ))
+            fig_eff.update_layout(template="plotly_dark")
+            st.plotly_chart(fig_eff, use_container_width=True)
+        else:
+            st.info("Switch to 'Optimal Sharpe' to visualize the Efficient Frontier.")
+
+    # --- SECTION 4: STRESS TESTING ---
+    st.divider()
+    st.subheader("4. Stress Testing & Scenario Replay")
+
+    tester = StressTester(df)
+    tester.add_available_historical()
+    col_shock, col_table = st.columns([1, 2])
+    with col_shock:
+        st.write("**Factor Shocks (propagated via covariance)**")
+        shock_assets = st.multiselect("Shocked Assets", assets, default=assets[-1:])
+        shock_size = st.slider("Shock Size", -0.50, 0.50, -0.20, 0.05)
+        if shock_assets:
+            tester.add_shock(f"Shock {', '.join(shock_assets)} {shock_size:+.0%}",
+                             {a: shock_size for a in shock_assets})
+
+    with col_table:
+        if tester.scenarios:
+            stress_report = tester.report(display_weights)
+            st.dataframe(stress_report.style.format("{:.2%}"), use_container_width=True)
         else:
-            st.info("Switch to 'Optimal Sharpe' to visualize the Efficient Frontier.")
\ No newline at end of file
+            st.info("No historical scenario falls within the selected horizon. Extend the horizon or add a shock.")
+
+    # Screen every Monte Carlo candidate against every scenario in one pass
+    if mode == "Optimal Sharpe (Markowitz)" and tester.scenarios:
+        candidates = opt_results['weights_record']
+        pnl, _ = tester.run(candidates)
+        worst_case = pnl.min(axis=1).to_numpy()
+        mc_data = opt_results['monte_carlo_results']
+        fig_stress = px.scatter(
+            x=mc_data[0], y=worst_case, color=mc_data[2],
+            labels={'x': 'Volatility', 'y': 'Worst-Case Scenario P&L', 'color': 'Sharpe'},
+            color_continuous_scale='Viridis', title="Candidate Portfolios: Volatility vs. Worst-Case Stress Loss"
+        )
+        fig_stress.update_layout(template="plotly_dark")
+        st.plotly_chart(fig_stress, use_container_width=True)
+
+        resilient = candidates[np.argmax(worst_case)]
+        st.caption("Most resilient candidate: " + ", ".join(f"{a} {w:.0%}" for a, w in zip(assets, resilient)))
+
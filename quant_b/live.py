@@ -0,0 +1,148 @@
+import copy
+from collections import deque
+import numpy as np
+import pandas as pd
+from utils.metrics import metrics_from_moments, RISK_FREE_RATE, TRADING_DAYS
+
+
+class LivePortfolio:
+    """
+    Incrementally updated portfolio state for the live monitor.
+    Seeded once from the full history, then each new bar updates the equity curve,
+    drawdown, rolling volatility and the asset covariance in O(assets^2),
+    without refetching or recomputing the history.
+    """
+
+    def __init__(self, df_prices: pd.DataFrame, weights: list, window: int = 21,
+                 risk_free_rate: float = RISK_FREE_RATE, periods_per_year: int = TRADING_DAYS):
+        self.assets = df_prices.columns.tolist()
+        weights = np.array(weights, dtype=np.float64)
+        self.weights = weights / np.sum(weights) if np.sum(weights) != 0 else weights
+        self.window = window
+        self.risk_free_rate = risk_free_rate
+        self.periods_per_year = periods_per_year
+
+        # Seed the running statistics from the history in one vectorized pass.
+        # The last bar is applied incrementally so it can be revised while still forming.
+        prices = df_prices.dropna()
+        prices, last_bar = prices.iloc[:-1], prices.iloc[[-1]]
+        asset_returns = prices.pct_change().dropna()
+        port_returns = asset_returns.to_numpy().dot(self.weights)
+        wealth = np.cumprod(np.concatenate(([1.0], 1 + port_returns)))
+        peak = np.maximum.accumulate(wealth)
+        steps = np.arange(len(wealth))
+        last_peak = np.maximum.accumulate(np.where(wealth == peak, steps, 0))
+
+        self.last_time = prices.index[-1]
+        self.last_prices = prices.iloc[-1].to_numpy(dtype=np.float64)
+        self.equity, self.peak = wealth[-1], peak[-1]
+        self.max_drawdown = ((wealth - peak) / peak).min()
+        self.last_peak, self.max_duration = last_peak[-1], (steps - last_peak).max()
+        self.n = len(port_returns)
+        self.mean = port_returns.mean() if self.n else 0.0
+        self.m2 = ((port_returns - self.mean) ** 2).sum()
+        self.downside_sq = (np.minimum(port_returns - risk_free_rate / periods_per_year, 0) ** 2).sum()
+        self.hits = (port_returns > 0).sum()
+        self.asset_mean = asset_returns.mean().to_numpy() if self.n else np.zeros(len(self.assets))
+        centered = asset_returns.to_numpy() - self.asset_mean
+        self.comoment = centered.T.dot(centered)
+        self.recent = deque(port_returns[-window:], maxlen=window)
+
+        self.history = pd.DataFrame({
+            "Daily_Return": port_returns,
+            "Cumulative": wealth[1:],
+            "Drawdown": ((wealth - peak) / peak)[1:]
+        }, index=asset_returns.index)
+        self._before_last = None
+        self.update(last_bar)
+
+    def _state(self):
+        return (self.last_prices, self.equity, self.peak, self.max_drawdown, self.last_peak,
+                self.max_duration, self.n, self.mean, self.m2, self.downside_sq, self.hits,
+                self.asset_mean, self.comoment, copy.copy(self.recent))
+
+    def _restore(self, state):
+        (self.last_prices, self.equity, self.peak, self.max_drawdown, self.last_peak,
+         self.max_duration, self.n, self.mean, self.m2, self.downside_sq, self.hits,
+         self.asset_mean, self.comoment, self.recent) = state
+
+    def _apply(self, prices: np.ndarray):
+        asset_ret = prices / self.last_prices - 1
+        ret = asset_ret.dot(self.weights)
+
+        # Welford updates (portfolio variance and asset co-moments)
+        self.n += 1
+        delta = ret - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (ret - self.mean)
+        self.downside_sq += min(ret - self.risk_free_rate / self.periods_per_year, 0) ** 2
+        self.hits += ret > 0
+        asset_delta = asset_ret - self.asset_mean
+        self.asset_mean = self.asset_mean + asset_delta / self.n
+        self.comoment = self.comoment + np.outer(asset_delta, asset_ret - self.asset_mean)
+
+        self.equity *= 1 + ret
+        self.peak = max(self.peak, self.equity)
+        drawdown = (self.equity - self.peak) / self.peak
+        self.max_drawdown = min(self.max_drawdown, drawdown)
+        if drawdown == 0:
+            self.last_peak = self.n
+        self.max_duration = max(self.max_duration, self.n - self.last_peak)
+        self.recent.append(ret)
+        self.last_prices = prices
+        return ret, drawdown
+
+    def update(self, new_prices: pd.DataFrame) -> pd.DataFrame:
+        """
+        Appends the latest bars and returns only the new (or revised) points.
+        A bar carrying the same timestamp as the last one is treated as a revision
+        of the still-forming bar: its previous contribution is rolled back first.
+        An empty poll, or one missing some of the assets, leaves the state unchanged.
+        """
+        if new_prices is None or new_prices.empty or not set(self.assets).issubset(new_prices.columns):
+            return self.history.iloc[0:0]
+        new_prices = new_prices[self.assets].dropna()
+        new_prices = new_prices.loc[new_prices.index >= self.last_time]
+        points = {}
+
+        for timestamp, row in new_prices.iterrows():
+            if timestamp == self.last_time:
+                if self._before_last is None:
+                    continue
+                self._restore(self._before_last)
+                self._before_last = self._state()
+                if timestamp not in points:
+                    self.history = self.history.iloc[:-1]
+            else:
+                self._before_last = self._state()
+
+            ret, drawdown = self._apply(row.to_numpy(dtype=np.float64))
+            self.last_time = timestamp
+            points[timestamp] = (ret, self.equity, drawdown)
+
+        if not points:
+            return self.history.iloc[0:0]
+
+        new_points = pd.DataFrame.from_dict(points, orient="index", columns=self.history.columns)
+        self.history = pd.concat([self.history, new_points])
+        return new_points
+
+    def covariance(self) -> pd.DataFrame:
+        """Sample covariance of asset returns, kept up to date bar by bar."""
+        cov = self.comoment / (self.n - 1) if self.n > 1 else np.full_like(self.comoment, np.nan)
+        return pd.DataFrame(cov, index=self.assets, columns=self.assets)
+
+    def correlation(self) -> pd.DataFrame:
+        """Pearson correlation derived from the running covariance."""
+        cov = self.covariance()
+        std = np.sqrt(np.diag(cov))
+        return cov / np.outer(std, std)
+
+    def metrics(self) -> dict:
+        """Running portfolio metrics (same keys as `simulate_portfolio`, plus Rolling Volatility)."""
+        metrics = metrics_from_moments(
+            self.n, self.mean, self.m2 / (self.n - 1) if self.n > 1 else np.nan,
+            self.downside_sq / self.n if self.n else np.nan, self.equity - 1, self.max_drawdown,
+            self.max_duration, self.hits, self.risk_free_rate, self.periods_per_year)
+        rolling_vol = np.std(self.recent, ddof=1) * np.sqrt(self.periods_per_year) if len(self.recent) > 1 else np.nan
+        return {**metrics, "Rolling Volatility": rolling_vol}
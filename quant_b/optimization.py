@@ -1,13 +1,15 @@
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pandas as pd
 from scipy.optimize import minimize
+from utils.metrics import RISK_FREE_RATE, TRADING_DAYS
 
-def get_portfolio_performance(weights, returns):
+def get_portfolio_performance(weights, returns, risk_free_rate=RISK_FREE_RATE, periods_per_year=TRADING_DAYS):
     """Calculates annualized return, volatility, and Sharpe ratio."""
     weights = np.array(weights)
-    port_return = np.sum(returns.mean() * weights) * 252
-    port_vol = np.sqrt(np.dot(weights.T, np.dot(returns.cov() * 252, weights)))
-    sharpe = (port_return - 0.02) / port_vol if port_vol != 0 else 0
+    port_return = np.sum(returns.mean() * weights) * periods_per_year
+    port_vol = np.sqrt(np.dot(weights.T, np.dot(returns.cov() * periods_per_year, weights)))
+    sharpe = (port_return - risk_free_rate) / port_vol if port_vol != 0 else 0
     return port_return, port_vol, sharpe
 
 def optimize_portfolio(df):
@@ -48,7 +50,8 @@ def optimize_portfolio(df):
         'return': opt_ret,
         'volatility': opt_vol,
         'sharpe': opt_sharpe,
-        'weights': weights_dict
+        'weights': weights_dict,
+        'weights_record': np.array(weights_record)
     }
 
 def get_min_variance_weights(returns):
@@ -62,4 +65,153 @@ def get_min_variance_weights(returns):
 
     res = minimize(min_vol_func, num_assets * [1./num_assets], 
                    method='SLSQP', bounds=bounds, constraints=constraints)
-    return res.x
\ No newline at end of file
+    return res.x
+
+# Asset-class taxonomy of the default universe (see main.ASSET_MAP)
+ASSET_CLASSES = {
+    "AAPL": "Equity", "MSFT": "Equity", "GOOGL": "Equity",
+    "AMZN": "Equity", "TSLA": "Equity", "NVDA": "Equity",
+    "BTC-USD": "Crypto", "ETH-USD": "Crypto", "GOLD": "Commodity",
+    "EURUSD=X": "FX", "^FCHI": "Index", "^GSPC": "Index"
+}
+
+_WORKER_INPUTS = None
+
+def prepare_optimizer_inputs(df, periods_per_year=TRADING_DAYS):
+    """
+    Annualized expected returns, covariance and its Cholesky factor.
+    Computed once and shared by every scenario solved on the same universe.
+    """
+    returns = df.pct_change().dropna()
+    mu = returns.mean().to_numpy() * periods_per_year
+    cov = returns.cov().to_numpy() * periods_per_year
+    # Tiny ridge keeps the factorization valid for (near) collinear assets
+    chol = np.linalg.cholesky(cov + 1e-12 * np.eye(len(mu)))
+    return {'assets': df.columns.tolist(), 'mu': mu, 'cov': cov, 'chol': chol}
+
+def _bound_vector(value, assets, default):
+    if value is None:
+        return np.full(len(assets), default)
+    if isinstance(value, dict):
+        return np.array([value.get(a, default) for a in assets], dtype=np.float64)
+    return np.full(len(assets), float(value))
+
+def _solve_constrained(inputs, objective='max_sharpe', min_weight=0.0, max_weight=1.0,
+                       group_limits=None, asset_classes=None, current_weights=None,
+                       turnover_penalty=0.0, target_volatility=None, risk_aversion=1.0,
+                       risk_free_rate=RISK_FREE_RATE):
+    assets, mu, cov, chol = inputs['assets'], inputs['mu'], inputs['cov'], inputs['chol']
+    n = len(assets)
+    lower = _bound_vector(min_weight, assets, 0.0)
+    upper = _bound_vector(max_weight, assets, 1.0)
+
+    w0 = _bound_vector(current_weights, assets, 0.0) if current_weights is not None else np.full(n, 1.0 / n)
+    use_turnover = turnover_penalty > 0 and current_weights is not None
+
+    # Decision vector: weights, plus buy/sell legs (w = w0 + buy - sell) for an exact L1 turnover term
+    def split(x):
+        return x[:n], x[n:2 * n], x[2 * n:]
+
+    def variance(w):
+        v = chol.T.dot(w)
+        return v.dot(v), 2 * chol.dot(v)
+
+    def objective_fn(x):
+        w, buy, sell = split(x)
+        var, d_var = variance(w)
+        if objective == 'max_sharpe':
+            vol = np.sqrt(max(var, 1e-16))
+            excess = mu.dot(w) - risk_free_rate
+            value = -excess / vol
+            grad_w = -(mu / vol - excess * d_var / (2 * vol ** 3))
+        elif objective == 'min_variance':
+            value, grad_w = var, d_var
+        elif objective == 'max_return':
+            value, grad_w = -mu.dot(w), -mu
+        elif objective == 'mean_variance':
+            value = -mu.dot(w) + 0.5 * risk_aversion * var
+            grad_w = -mu + 0.5 * risk_aversion * d_var
+        else:
+            raise ValueError(f"Unknown objective: {objective}")
+
+        grad = np.concatenate([grad_w, np.full(len(x) - n, turnover_penalty)])
+        return value + turnover_penalty * (buy.sum() + sell.sum()), grad
+
+    n_vars = 3 * n if use_turnover else n
+    constraints = [{'type': 'eq', 'fun': lambda x: np.sum(x[:n]) - 1,
+                    'jac': lambda x: np.concatenate([np.ones(n), np.zeros(n_vars - n)])}]
+
+    if use_turnover:
+        link = np.hstack([np.eye(n), -np.eye(n), np.eye(n)])
+        constraints.append({'type': 'eq', 'fun': lambda x: link.dot(x) - w0, 'jac': lambda x: link})
+
+    if group_limits:
+        classes = asset_classes or ASSET_CLASSES
+        for group, (g_min, g_max) in group_limits.items():
+            member = np.array([classes.get(a) == group for a in assets], dtype=np.float64)
+            row = np.concatenate([member, np.zeros(n_vars - n)])
+            constraints.append({'type': 'ineq', 'fun': lambda x, r=row, lo=g_min: r.dot(x) - lo,
+                                'jac': lambda x, r=row: r})
+            constraints.append({'type': 'ineq', 'fun': lambda x, r=row, hi=g_max: hi - r.dot(x),
+                                'jac': lambda x, r=row: -r})
+
+    if target_volatility is not None:
+        def vol_gap(x):
+            return target_volatility ** 2 - variance(x[:n])[0]
+
+        def vol_gap_jac(x):
+            return np.concatenate([-variance(x[:n])[1], np.zeros(n_vars - n)])
+        constraints.append({'type': 'ineq', 'fun': vol_gap, 'jac': vol_gap_jac})
+
+    bounds = list(zip(lower, upper)) + [(0, None)] * (n_vars - n)
+    start_w = np.clip(w0, lower, upper)
+    x0 = np.concatenate([start_w, np.maximum(start_w - w0, 0), np.maximum(w0 - start_w, 0)])[:n_vars]
+
+    res = minimize(objective_fn, x0, jac=True, method='SLSQP', bounds=bounds,
+                   constraints=constraints, options={'ftol': 1e-15, 'maxiter': 500})
+
+    weights = res.x[:n]
+    port_ret = mu.dot(weights)
+    port_vol = np.sqrt(weights.dot(cov).dot(weights))
+    return {
+        'return': port_ret,
+        'volatility': port_vol,
+        'sharpe': (port_ret - risk_free_rate) / port_vol if port_vol != 0 else 0,
+        'turnover': np.abs(weights - w0).sum() if current_weights is not None else 0.0,
+        'weights': {assets[i]: weights[i] for i in range(n)},
+        'success': bool(res.success),
+        'message': res.message
+    }
+
+def optimize_constrained(df, periods_per_year=TRADING_DAYS, **constraints):
+    """
+    Exact constraint-aware optimizer (SLSQP with analytic gradients).
+    Supports min/max weights (scalar or per-asset dict), group limits by asset class
+    ({'Crypto': (0.0, 0.10)}), an L1 turnover penalty against `current_weights`,
+    a target volatility cap, and the objectives 'max_sharpe', 'min_variance',
+    'max_return' and 'mean_variance'.
+    """
+    return _solve_constrained(prepare_optimizer_inputs(df, periods_per_year), **constraints)
+
+def _init_worker(inputs):
+    global _WORKER_INPUTS
+    _WORKER_INPUTS = inputs
+
+def _solve_in_worker(scenario):
+    return _solve_constrained(_WORKER_INPUTS, **scenario)
+
+def optimize_scenarios(df, scenarios, n_jobs=None, periods_per_year=TRADING_DAYS, **base_constraints):
+    """
+    Batch what-if API: solves every scenario (a dict of constraint overrides on top
+    of `base_constraints`) against the same universe in one call. Moments and the
+    Cholesky factor are computed once and shipped to each worker a single time.
+    Use n_jobs=1 to solve in-process.
+    """
+    inputs = prepare_optimizer_inputs(df, periods_per_year)
+    specs = [{**base_constraints, **scenario} for scenario in scenarios]
+
+    if n_jobs == 1 or len(specs) < 2:
+        return [_solve_constrained(inputs, **spec) for spec in specs]
+
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker, initargs=(inputs,)) as pool:
+        return list(pool.map(_solve_in_worker, specs))
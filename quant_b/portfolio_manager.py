@@ -1,7 +1,9 @@
 import numpy as np
 import pandas as pd
+from utils.metrics import compute_metrics, metrics_from_moments, RISK_FREE_RATE, TRADING_DAYS
 
-def simulate_portfolio(df_prices: pd.DataFrame, weights: list) -> dict:
+def simulate_portfolio(df_prices: pd.DataFrame, weights: list, risk_free_rate: float = RISK_FREE_RATE,
+                       periods_per_year: int = TRADING_DAYS) -> dict:
     """
     Computes portfolio performance based on asset prices and weight allocation.
     Includes performance attribution and risk-adjusted metrics.
@@ -24,34 +26,101 @@ def simulate_portfolio(df_prices: pd.DataFrame, weights: list) -> dict:
     if portfolio_cumulative_returns.empty:
         return {"cumulative_returns": pd.Series(), "daily_returns": pd.Series(), "metrics": {}}
 
-    # 5. Performance Metrics Calculation
-    total_return = portfolio_cumulative_returns.iloc[-1] - 1
-    annual_volatility = portfolio_daily_returns.std() * np.sqrt(252)
-
-    # Sharpe Ratio: (Mean Return - Risk Free Rate) / Volatility
-    # Using 2.0% as a standard institutional risk-free rate baseline
-    risk_free_rate = 0.02
-    excess_return = (portfolio_daily_returns.mean() * 252) - risk_free_rate
-    
-    if annual_volatility > 0:
-        sharpe_ratio = excess_return / annual_volatility
-    else:
-        sharpe_ratio = 0.0
-    
-    # 6. Max Drawdown Analysis
-    rolling_max = portfolio_cumulative_returns.cummax()
-    drawdown = (portfolio_cumulative_returns - rolling_max) / rolling_max
-    max_drawdown = drawdown.min()
-
-    metrics = {
-        "Total Return": total_return,
-        "Annual Volatility": annual_volatility,
-        "Sharpe Ratio": sharpe_ratio,
-        "Max Drawdown": max_drawdown
-    }
+    # 5. Performance Metrics (shared vectorized engine)
+    metrics = compute_metrics(portfolio_daily_returns, risk_free_rate, periods_per_year).iloc[0].to_dict()
     
     return {
         "cumulative_returns": portfolio_cumulative_returns,
         "daily_returns": portfolio_daily_returns,
         "metrics": metrics
-    }
\ No newline at end of file
+    }
+
+def iter_portfolio_chunks(chunks, weights: list):
+    """
+    Streams the portfolio simulation over chronological price chunks.
+    Rows where any asset has no price (mixed crypto / equity calendars) are
+    dropped, as `dropna()` does in memory. The last complete price row, the
+    equity level and the running peak are carried across chunk boundaries, so
+    each yielded frame matches the in-memory path.
+    """
+    weights = np.array(weights)
+    if np.sum(weights) != 0:
+        weights = weights / np.sum(weights)
+
+    last_prices = None
+    equity, peak = 1.0, 1.0
+
+    for chunk in chunks:
+        chunk = chunk.dropna()
+        if chunk.empty:
+            continue
+        data = chunk if last_prices is None else pd.concat([last_prices, chunk])
+        asset_returns = data.pct_change().iloc[len(data) - len(chunk):].dropna()
+        last_prices = chunk.iloc[[-1]]
+        if asset_returns.empty:
+            continue
+
+        daily_returns = asset_returns.dot(weights)
+        cumulative = np.cumprod(np.concatenate(([equity], (1 + daily_returns).to_numpy())))[1:]
+        running_max = np.maximum.accumulate(np.concatenate(([peak], cumulative)))[1:]
+        equity, peak = cumulative[-1], running_max[-1]
+
+        yield pd.DataFrame({
+            "Daily_Return": daily_returns,
+            "Cumulative": cumulative,
+            "Drawdown": (cumulative - running_max) / running_max
+        }, index=daily_returns.index)
+
+
+def simulate_portfolio_out_of_core(chunks, weights: list, keep_series: bool = True,
+                                   risk_free_rate: float = RISK_FREE_RATE,
+                                   periods_per_year: int = TRADING_DAYS) -> dict:
+    """
+    Out-of-core counterpart of `simulate_portfolio`.
+    Return moments (Chan's parallel mean/variance update), downside deviation, hit
+    count and drawdown duration are accumulated chunk by chunk, so only one chunk of
+    the universe is ever held in memory while reporting the same metrics.
+    Set `keep_series=False` for very long histories (e.g. minute bars).
+    """
+    n, mean, m2 = 0, 0.0, 0.0
+    downside_sq, hits = 0.0, 0
+    equity, max_drawdown = 1.0, 0.0
+    last_peak, max_duration = 0, 0
+    daily_parts, cumulative_parts = [], []
+
+    for frame in iter_portfolio_chunks(chunks, weights):
+        r = frame["Daily_Return"].to_numpy()
+        n_b, mean_b = len(r), r.mean()
+        m2_b = ((r - mean_b) ** 2).sum()
+        delta = mean_b - mean
+        total = n + n_b
+        mean += delta * n_b / total
+        m2 += m2_b + delta ** 2 * n * n_b / total
+        downside_sq += (np.minimum(r - risk_free_rate / periods_per_year, 0) ** 2).sum()
+        hits += int((r > 0).sum())
+
+        # Step 0 is the base wealth of 1.0; the carried peak step links the chunks
+        steps = np.arange(n + 1, total + 1)
+        peaks = np.maximum.accumulate(np.where(frame["Drawdown"].to_numpy() == 0, steps, last_peak))
+        max_duration = max(max_duration, int((steps - peaks).max()))
+        last_peak = peaks[-1]
+        n = total
+
+        equity = frame["Cumulative"].iloc[-1]
+        max_drawdown = min(max_drawdown, frame["Drawdown"].min())
+        if keep_series:
+            daily_parts.append(frame["Daily_Return"])
+            cumulative_parts.append(frame["Cumulative"])
+
+    if n == 0:
+        return {"cumulative_returns": pd.Series(), "daily_returns": pd.Series(), "metrics": {}}
+
+    metrics = metrics_from_moments(n, mean, m2 / (n - 1) if n > 1 else np.nan, downside_sq / n,
+                                   equity - 1, max_drawdown, max_duration, hits,
+                                   risk_free_rate, periods_per_year)
+
+    return {
+        "cumulative_returns": pd.concat(cumulative_parts) if keep_series else pd.Series(),
+        "daily_returns": pd.concat(daily_parts) if keep_series else pd.Series(),
+        "metrics": metrics
+    }
@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+
+# Historical shock windows (start, end) replayed against the current universe
+HISTORICAL_SCENARIOS = {
+    "GFC (Lehman)": ("2008-09-12", "2009-03-09"),
+    "Euro Debt Crisis": ("2011-07-22", "2011-10-03"),
+    "China Devaluation": ("2015-08-10", "2015-08-25"),
+    "Volmageddon": ("2018-01-26", "2018-02-08"),
+    "Q4 2018 Selloff": ("2018-10-03", "2018-12-24"),
+    "COVID Crash": ("2020-02-19", "2020-03-23"),
+    "Crypto Winter": ("2021-11-08", "2022-06-18"),
+    "2022 Rate Shock": ("2022-01-03", "2022-10-12"),
+    "SVB Banking Stress": ("2023-03-08", "2023-03-15"),
+}
+
+
+class StressTester:
+    """
+    Scenario engine for stress-testing many portfolios at once.
+    Each scenario is stored as a path of cumulative asset growth (time x assets).
+    Portfolios are held buy-and-hold from the start of the shock, so the value of
+    every portfolio in every scenario is linear in the weights: the whole
+    (scenarios x portfolios) evaluation is a single matrix product.
+    """
+
+    def __init__(self, df_prices: pd.DataFrame):
+        self.assets = df_prices.columns.tolist()
+        self.prices = df_prices
+        self.returns = df_prices.pct_change().iloc[1:]
+        self.scenarios = {}
+
+    @classmethod
+    def from_archive(cls, archive, tickers=None, scenarios=None, cov_start=None, cov_end=None):
+        """
+        Builds a tester from a long on-disk price archive, loading only the
+        scenario windows (plus one bar of history each) into memory.
+        The covariance used by `add_shock` is estimated on [cov_start, cov_end];
+        without a window, only non-propagated shocks can be added.
+        """
+        tickers = tickers or archive.tickers
+        if cov_start is not None or cov_end is not None:
+            history = archive.load(tickers=tickers, start=cov_start, end=cov_end)
+        else:
+            history = pd.DataFrame(columns=tickers, dtype=np.float64)
+        tester = cls(history)
+        for name, (start, end) in (scenarios or HISTORICAL_SCENARIOS).items():
+            lead_in = pd.Timestamp(start) - pd.Timedelta(days=7)
+            window = archive.load(tickers=tickers, start=lead_in, end=end)
+            if not window.empty:
+                tester.add_historical(name, start, end, prices=window)
+        return tester
+
+    def add_historical(self, name, start, end, prices=None):
+        """
+        Replays the asset returns realized between `start` and `end`.
+        The growth path is computed once here and cached for every later run.
+        Assets without data in the window are treated as flat. The history must
+        reach back to `start`, so a partly covered crisis is never replayed
+        under its full name.
+        """
+        prices = self.prices if prices is None else prices
+        before = prices.loc[prices.index < pd.Timestamp(start)]
+        window = prices.loc[start:end]
+        if window.empty:
+            raise ValueError(f"No price data between {start} and {end} for scenario '{name}'.")
+        if before.empty and window.index[0] > pd.Timestamp(start):
+            raise ValueError(f"Price history starts after {start}: scenario '{name}' is only partly covered.")
+
+        # Anchor on the last close before the window so the first day's move is included
+        if not before.empty:
+            window = pd.concat([before.iloc[[-1]], window])
+        returns = window[self.assets].pct_change().iloc[1:].fillna(0)
+        if returns.empty:
+            raise ValueError(f"Scenario '{name}' spans a single bar.")
+        self.scenarios[name] = np.cumprod(1 + returns.to_numpy(dtype=np.float64), axis=0)
+
+    def add_available_historical(self, scenarios=None):
+        """Adds every predefined window covered by the loaded history; returns their names."""
+        added = []
+        for name, (start, end) in (scenarios or HISTORICAL_SCENARIOS).items():
+            try:
+                self.add_historical(name, start, end)
+                added.append(name)
+            except ValueError:
+                continue
+        return added
+
+    def add_shock(self, name, shocks: dict, propagate: bool = True):
+        """
+        Instantaneous shock scenario, e.g. {'^GSPC': -0.20, 'BTC-USD': -0.40}.
+        With `propagate`, unshocked assets move by their conditional expectation
+        given the shocked ones, E[r_o | r_s] = Cov_os Cov_ss^-1 r_s, using the
+        covariance of the loaded history.
+        """
+        shocked = [a for a in self.assets if a in shocks]
+        if not shocked:
+            raise ValueError("Shocks must reference at least one asset of the universe.")
+        move = np.zeros(len(self.assets))
+        s_idx = [self.assets.index(a) for a in shocked]
+        s_vec = np.array([shocks[a] for a in shocked], dtype=np.float64)
+
+        if propagate:
+            if len(self.returns.dropna(how="all")) < 2:
+                raise ValueError("Propagated shocks need a price history to estimate the covariance "
+                                 "(pass cov_start / cov_end to from_archive, or propagate=False).")
+            cov = self.returns[self.assets].cov().to_numpy()
+            betas = np.linalg.lstsq(cov[np.ix_(s_idx, s_idx)], cov[s_idx, :], rcond=None)[0]
+            move = s_vec.dot(betas)
+        move[s_idx] = s_vec
+        self.scenarios[name] = (1 + np.clip(move, -1.0, None))[None, :]
+
+    def run(self, weights, portfolio_names=None):
+        """
+        Evaluates portfolios (K x assets weight matrix, or a single weight vector)
+        against every scenario. Returns (pnl, max_drawdown) as (K x scenarios) DataFrames.
+        """
+        W = np.atleast_2d(np.asarray(weights, dtype=np.float64))
+        sums = W.sum(axis=1, keepdims=True)
+        W = np.divide(W, sums, out=W.copy(), where=sums != 0)
+
+        names = list(self.scenarios)
+        paths = [self.scenarios[n] for n in names]
+        bounds = np.cumsum([0] + [len(p) for p in paths])
+
+        # One product: (all scenario bars x assets) @ (assets x portfolios)
+        values = np.vstack(paths).dot(W.T)
+
+        pnl = np.empty((len(W), len(names)))
+        drawdown = np.empty((len(W), len(names)))
+        for j in range(len(names)):
+            segment = np.vstack([np.ones((1, len(W))), values[bounds[j]:bounds[j + 1]]])
+            peak = np.maximum.accumulate(segment, axis=0)
+            pnl[:, j] = segment[-1] - 1
+            drawdown[:, j] = ((segment - peak) / peak).min(axis=0)
+
+        index = portfolio_names if portfolio_names is not None else range(len(W))
+        return (pd.DataFrame(pnl, index=index, columns=names),
+                pd.DataFrame(drawdown, index=index, columns=names))
+
+    def report(self, weights) -> pd.DataFrame:
+        """Per-scenario P&L and drawdown for a single portfolio."""
+        pnl, drawdown = self.run(weights)
+        return pd.DataFrame({"P&L": pnl.iloc[0], "Max Drawdown": drawdown.iloc[0]})
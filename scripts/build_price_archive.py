@@ -0,0 +1,44 @@
+import sys
+import os
+import argparse
+import yfinance as yf
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.price_store import write_price_archive, PriceArchive, MANIFEST_FILE, DEFAULT_ARCHIVE_PATH
+
+def build_archive(tickers, path, period="max", interval="1d", freq="Y"):
+    """
+    Downloads the full history of the universe and stores it as a memory-mapped,
+    date-chunked archive. If the archive already exists, only newer bars are appended.
+    """
+    tickers = [t.strip().upper() for t in tickers.split(',')]
+    print(f"[INFO] Downloading {len(tickers)} tickers (period={period}, interval={interval})...")
+
+    data = yf.download(tickers, period=period, interval=interval, auto_adjust=True)
+    if data.empty:
+        print("[ERROR] No data retrieved. Aborting.")
+        return
+
+    df_close = data['Close'][tickers] if len(tickers) > 1 else data[['Close']]
+    df_close.columns = tickers
+
+    if os.path.exists(os.path.join(path, MANIFEST_FILE)):
+        archive = PriceArchive(path)
+        last_end = archive.chunks[-1]["end"] if len(archive) else None
+        new_rows = df_close.loc[df_close.index > last_end] if last_end else df_close
+        archive.append(new_rows)
+        print(f"[SUCCESS] Appended {len(new_rows)} bars to {path}")
+    else:
+        archive = write_price_archive(df_close, path, freq=freq)
+        print(f"[SUCCESS] Archive written to {path} ({len(archive)} chunks)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build a memory-mapped price archive.")
+    parser.add_argument("tickers", help="Comma-separated tickers, e.g. 'AAPL,MSFT,BTC-USD'")
+    parser.add_argument("--path", default=DEFAULT_ARCHIVE_PATH)
+    parser.add_argument("--period", default="max")
+    parser.add_argument("--interval", default="1d")
+    parser.add_argument("--freq", default="Y", help="Chunk period: 'Y' for daily bars, 'M' or 'W' for intraday")
+    args = parser.parse_args()
+    build_archive(args.tickers, args.path, args.period, args.interval, args.freq)
@@ -6,6 +6,7 @@ from datetime import datetime
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from utils.data_loader import get_data
+from utils.feature_store import get_feature_store
 
 def generate_report():
     # 1. Configuration
@@ -19,9 +20,10 @@ def generate_report():
 
     print(f"[INFO] Starting daily report generation for {today_str}...")
 
-    # 2. Fetch Data (Last 5 days to calculate recent variations)
+    # 2. Fetch Data (3 months so RSI / historical volatility are warm; stored features only grow by the new bars)
     try:
-        df = get_data(tickers, period="5d")
+        df = get_data(tickers, period="3mo")
+        store = get_feature_store()
         
         if df.empty:
             print("[ERROR] No data retrieved. Aborting report.")
@@ -32,8 +34,8 @@ def generate_report():
         lines.append(f"DAILY FINANCIAL REPORT - {today_str}")
         lines.append("=" * 40)
         lines.append(f"Generated at: {datetime.now().strftime('%H:%M:%S')}\n")
-        lines.append(f"{'ASSET':<10} | {'CLOSE':<10} | {'RETURN 1D':<10} | {'VOLATILITY (5D)':<15}")
-        lines.append("-" * 55)
+        lines.append(f"{'ASSET':<10} | {'CLOSE':<10} | {'RETURN 1D':<10} | {'VOLATILITY (5D)':<15} | {'RSI (14)':<8} | {'HIST VOL (21D)':<14}")
+        lines.append("-" * 85)
 
         # Calculate metrics for each asset
         for ticker in df.columns:
@@ -46,10 +48,12 @@ def generate_report():
             prev_price = series.iloc[-2]
             daily_return = (current_price / prev_price) - 1
             
-            # Simple volatility (std dev of last 5 days returns)
-            recent_vol = series.pct_change().std()
+            # Shared features: simple volatility (std dev of last 5 daily returns), RSI and annualized volatility
+            recent_vol = store.get(ticker, series, 'return_vol', window=5).iloc[-1]
+            rsi = store.get(ticker, series, 'rsi', window=14).iloc[-1]
+            hist_vol = store.get(ticker, series, 'hist_vol', window=21).iloc[-1]
 
-            lines.append(f"{ticker:<10} | {current_price:<10.2f} | {daily_return:<10.2%} | {recent_vol:<15.2%}")
+            lines.append(f"{ticker:<10} | {current_price:<10.2f} | {daily_return:<10.2%} | {recent_vol:<15.2%} | {rsi:<8.1f} | {hist_vol:<14.2%}")
 
         # 4. Save to File
         with open(report_path, "w") as f:
@@ -0,0 +1,236 @@
+import sys
+import os
+import json
+import time
+import hashlib
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.data_loader import get_data
+from utils.price_store import PriceArchive
+from quant_a.strategies import (run_ma_crossover_strategy, run_bollinger_strategy, run_ai_strategy,
+                                get_performance_metrics)
+from quant_a.prediction import train_predict_ensemble
+from quant_b.portfolio_manager import simulate_portfolio
+from quant_b.optimization import optimize_portfolio, optimize_constrained, get_min_variance_weights
+from quant_b.risk import calculate_risk_metrics
+from quant_b.stress import StressTester
+
+_UNIVERSES = None
+
+STRATEGIES = {
+    "buy_and_hold": lambda df, ticker: run_ma_crossover_strategy(df, 1, 2).assign(
+        Cumulative_PNL=lambda d: d['Benchmark_PNL']),
+    "ma_crossover": lambda df, ticker, short_window, long_window: run_ma_crossover_strategy(
+        df, short_window, long_window),
+    "bollinger": lambda df, ticker, window, num_std: run_bollinger_strategy(df, window, num_std),
+}
+
+
+# --- JOB EXPANSION ---
+
+def _grid(params):
+    """Expands {'a': [1, 2], 'b': 3} into [{'a': 1, 'b': 3}, {'a': 2, 'b': 3}]."""
+    keys = sorted(params)
+    values = [v if isinstance(v, list) else [v] for v in (params[k] for k in keys)]
+    return [dict(zip(keys, combo)) for combo in itertools.product(*values)]
+
+def job_id(job):
+    return hashlib.sha1(json.dumps(job, sort_keys=True).encode()).hexdigest()[:12]
+
+def expand_jobs(spec, universes):
+    """
+    Turns a job spec into independent jobs:
+    one per (universe, ticker, strategy, parameter set), one per (universe, ticker)
+    prediction, and one per (universe, allocation mode).
+    Each job carries its data spec and the loaded date range, so its checkpoint id
+    changes whenever the underlying prices do.
+    """
+    jobs = []
+    for universe, df in universes.items():
+        data = {key: spec[key] for key in ("archive", "period", "start", "end") if spec.get(key) is not None}
+        if not df.empty:
+            data.update(first=str(df.index[0]), last=str(df.index[-1]), bars=len(df))
+        for ticker in df.columns:
+            for strategy, grid in spec.get("strategies", {}).items():
+                for params in _grid(grid or {}):
+                    jobs.append({"type": "strategy", "universe": universe, "ticker": ticker,
+                                 "strategy": strategy, "params": params, "data": data})
+            if spec.get("prediction"):
+                jobs.append({"type": "prediction", "universe": universe, "ticker": ticker, "data": data})
+
+        if len(df.columns) >= 2:
+            for allocation in spec.get("allocations", []):
+                if isinstance(allocation, str):
+                    allocation = {"mode": allocation}
+                jobs.append({"type": "portfolio", "universe": universe, "allocation": allocation,
+                             "risk": spec.get("risk", {}), "stress": spec.get("stress", False), "data": data})
+    return jobs
+
+
+# --- JOB EXECUTION (runs inside the worker processes) ---
+
+def _init_worker(universes, threads):
+    global _UNIVERSES
+    _UNIVERSES = universes
+    # One core per worker: keep XGBoost / BLAS from oversubscribing the machine
+    from threadpoolctl import threadpool_limits
+    threadpool_limits(limits=threads)
+
+def _strategy_job(df, job):
+    ticker, strategy, params = job["ticker"], job["strategy"], job["params"]
+    if strategy == "ai_ensemble":
+        results = run_ai_strategy(df, selected_asset=ticker, threshold=params.get("threshold", 0.5))
+    else:
+        results = STRATEGIES[strategy](df[[ticker]].dropna(), ticker, **params)
+    return get_performance_metrics(results['Cumulative_PNL'])
+
+def _prediction_job(df, job):
+    probability, _ = train_predict_ensemble(df, job["ticker"])
+    return {"Up Probability": probability}
+
+def _portfolio_job(df, job):
+    allocation = dict(job["allocation"])
+    mode = allocation.pop("mode")
+    assets = df.columns.tolist()
+
+    if mode == "equal_weight":
+        weights = [1.0 / len(assets)] * len(assets)
+    elif mode == "max_sharpe":
+        weights = list(optimize_portfolio(df)['weights'].values())
+    elif mode == "min_variance":
+        weights = list(get_min_variance_weights(df.pct_change().dropna()))
+    elif mode == "constrained":
+        # An infeasible spec fails the job instead of checkpointing the solver's last iterate
+        solution = optimize_constrained(df, **allocation)
+        if not solution['success']:
+            raise ValueError(f"Constrained optimization failed: {solution['message']}")
+        weights = list(solution['weights'].values())
+    else:
+        raise ValueError(f"Unknown allocation mode: {mode}")
+
+    results = simulate_portfolio(df, weights)
+    output = {**results['metrics'], **{f"w_{a}": w for a, w in zip(assets, weights)}}
+    risk = calculate_risk_metrics(results['daily_returns'], **job.get("risk", {}))
+    output.update(risk or {})
+
+    if job.get("stress"):
+        tester = StressTester(df)
+        if tester.add_available_historical():
+            report = tester.report(weights)
+            output["Worst Stress P&L"] = report["P&L"].min()
+            output["Worst Stress Scenario"] = report["P&L"].idxmin()
+    return output
+
+def run_job(job):
+    """Executes one job against the universes loaded in this worker."""
+    df = _UNIVERSES[job["universe"]]
+    handlers = {"strategy": _strategy_job, "prediction": _prediction_job, "portfolio": _portfolio_job}
+    return handlers[job["type"]](df, job)
+
+
+# --- BATCH DRIVER ---
+
+def _to_builtin(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Not JSON serializable: {type(value)}")
+
+def load_universes(spec):
+    """Loads every universe once in the parent process (from the archive when configured)."""
+    universes = {}
+    archive = PriceArchive(spec["archive"]) if spec.get("archive") else None
+    for name, tickers in spec["universes"].items():
+        if isinstance(tickers, list):
+            tickers = ",".join(tickers)
+        if archive is not None:
+            cols = [t.strip().upper() for t in tickers.split(',')]
+            df = archive.load(tickers=cols, start=spec.get("start"), end=spec.get("end")).dropna()
+        else:
+            df = get_data(tickers, period=spec.get("period", "1y"))
+        if df.empty:
+            print(f"[ERROR] No data for universe '{name}'. Skipping.")
+            continue
+        universes[name] = df
+    return universes
+
+def write_results(rows, output_dir, fmt):
+    """Writes one table per job type as Parquet (when pyarrow is available) or JSON."""
+    for job_type in sorted({r["type"] for r in rows}):
+        table = pd.json_normalize([r for r in rows if r["type"] == job_type], sep="_")
+        path = os.path.join(output_dir, f"{job_type}_results")
+        if fmt == "parquet":
+            try:
+                table.to_parquet(f"{path}.parquet", index=False)
+                print(f"[SUCCESS] {len(table)} {job_type} results saved to {path}.parquet")
+                continue
+            except ImportError:
+                print("[WARN] Parquet engine not installed (pip install pyarrow). Falling back to JSON.")
+        table.to_json(f"{path}.json", orient="records", indent=2)
+        print(f"[SUCCESS] {len(table)} {job_type} results saved to {path}.json")
+
+def run_batch(spec, output_dir, n_jobs=None, threads_per_worker=1, fmt="parquet"):
+    """
+    Runs every job of the spec on a process pool. Each finished job is checkpointed
+    to <output_dir>/jobs/<job_id>.json, so an interrupted batch resumes where it stopped.
+    """
+    checkpoint_dir = os.path.join(output_dir, "jobs")
+    os.makedirs(checkpoint_dir, exist_ok=True)
+
+    universes = load_universes(spec)
+    jobs = expand_jobs(spec, universes)
+    pending = [j for j in jobs if not os.path.exists(os.path.join(checkpoint_dir, f"{job_id(j)}.json"))]
+    print(f"[INFO] {len(jobs)} jobs in spec, {len(jobs) - len(pending)} already checkpointed, "
+          f"{len(pending)} to run.")
+
+    start, done, failed = time.time(), 0, 0
+    if pending:
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker,
+                                 initargs=(universes, threads_per_worker)) as pool:
+            futures = {pool.submit(run_job, job): job for job in pending}
+            for future in as_completed(futures):
+                job = futures[future]
+                done += 1
+                try:
+                    result = future.result()
+                except Exception as e:
+                    failed += 1
+                    print(f"[ERROR] [{done}/{len(pending)}] {job_id(job)} failed: {e}")
+                    continue
+                # Write then rename, so an interrupted run never leaves a truncated checkpoint
+                path = os.path.join(checkpoint_dir, f"{job_id(job)}.json")
+                with open(f"{path}.tmp", "w") as f:
+                    json.dump({**job, "result": result}, f, default=_to_builtin)
+                os.replace(f"{path}.tmp", path)
+                print(f"[INFO] [{done}/{len(pending)}] {job['type']} {job.get('ticker', job['universe'])} "
+                      f"done ({time.time() - start:.1f}s elapsed)")
+
+    rows = []
+    for job in jobs:
+        path = os.path.join(checkpoint_dir, f"{job_id(job)}.json")
+        if os.path.exists(path):
+            with open(path) as f:
+                rows.append(json.load(f))
+    if rows:
+        write_results(rows, output_dir, fmt)
+    print(f"[INFO] Batch finished: {len(rows)}/{len(jobs)} jobs complete, {failed} failed this run.")
+    return rows
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless batch runner for quant_a / quant_b analyses.")
+    parser.add_argument("spec", help="Path to a JSON job spec (see scripts/jobs/example.json)")
+    parser.add_argument("--output", default=None, help="Output folder (default: data/batch/<spec name>)")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--threads", type=int, default=1, help="Threads per worker")
+    parser.add_argument("--format", choices=["parquet", "json"], default="parquet")
+    args = parser.parse_args()
+
+    with open(args.spec) as f:
+        job_spec = json.load(f)
+    output = args.output or os.path.join("data", "batch", job_spec.get("name", "batch"))
+    run_batch(job_spec, output, n_jobs=args.jobs, threads_per_worker=args.threads, fmt=args.format)
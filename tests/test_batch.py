@@ -0,0 +1,78 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+import pandas as pd
+
+# Add project root and scripts to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scripts')))
+
+from run_batch import run_batch, expand_jobs, job_id, _grid
+from utils.price_store import write_price_archive
+from quant_a.strategies import run_bollinger_strategy, get_performance_metrics
+from tests.test_price_store import make_prices
+
+
+class TestBatchRunner(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.prices = make_prices(n_days=500, tickers=("AAPL", "MSFT", "BTC-USD"))
+        write_price_archive(self.prices, os.path.join(self.tmp.name, "archive"))
+        self.spec = {
+            "name": "test",
+            "archive": os.path.join(self.tmp.name, "archive"),
+            "universes": {"mixed": "AAPL, MSFT, BTC-USD"},
+            "strategies": {"buy_and_hold": {}, "bollinger": {"window": [20, 30], "num_std": 2.0}},
+            "allocations": ["equal_weight", {"mode": "constrained", "group_limits": {"Crypto": [0.0, 0.1]}}],
+            "stress": True
+        }
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_job_expansion(self):
+        self.assertEqual(len(_grid({"a": [1, 2], "b": [3, 4], "c": 5})), 4)
+        jobs = expand_jobs(self.spec, {"mixed": self.prices})
+        self.assertEqual(len(jobs), 3 * 3 + 2)
+
+        # A different data spec or price history never reuses a checkpoint
+        ids = {job_id(j) for j in jobs}
+        for spec, prices in [({**self.spec, "end": "2020-12-31"}, self.prices),
+                             (self.spec, self.prices.iloc[:-1])]:
+            self.assertFalse(ids & {job_id(j) for j in expand_jobs(spec, {"mixed": prices})})
+
+    def test_parallel_run_and_resume(self):
+        """Jobs run on a process pool, results match direct calls, and reruns resume from checkpoints."""
+        output = os.path.join(self.tmp.name, "out")
+        rows = run_batch(self.spec, output, n_jobs=2, fmt="json")
+        self.assertEqual(len(rows), 11)
+
+        strategies = pd.read_json(os.path.join(output, "strategy_results.json"))
+        row = strategies[(strategies["ticker"] == "MSFT") & (strategies["params_window"] == 20)].iloc[0]
+        expected = get_performance_metrics(run_bollinger_strategy(self.prices[["MSFT"]], 20, 2.0)['Cumulative_PNL'])
+        self.assertAlmostEqual(row["result_Sharpe Ratio"], expected["Sharpe Ratio"])
+
+        portfolios = pd.read_json(os.path.join(output, "portfolio_results.json"))
+        constrained = portfolios[portfolios["allocation_mode"] == "constrained"].iloc[0]
+        self.assertLessEqual(constrained["result_w_BTC-USD"], 0.1 + 1e-8)
+
+        checkpoint = os.listdir(os.path.join(output, "jobs"))[0]
+        with open(os.path.join(output, "jobs", checkpoint)) as f:
+            self.assertIn("result", json.load(f))
+        os.remove(os.path.join(output, "jobs", checkpoint))
+        self.assertEqual(len(run_batch(self.spec, output, n_jobs=1, fmt="json")), 11)
+
+    def test_infeasible_allocation_not_checkpointed(self):
+        """A constrained allocation the solver cannot satisfy fails instead of recording its iterate."""
+        spec = {**self.spec, "strategies": {}, "stress": False,
+                "allocations": [{"mode": "constrained", "target_volatility": 0.01}]}
+        output = os.path.join(self.tmp.name, "infeasible")
+        self.assertEqual(run_batch(spec, output, n_jobs=1, fmt="json"), [])
+        self.assertEqual(os.listdir(os.path.join(output, "jobs")), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
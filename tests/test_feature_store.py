@@ -0,0 +1,124 @@
+import unittest
+import sys
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.feature_store import FeatureStore, compute_feature, FEATURES
+from utils.price_store import write_price_archive
+from quant_a.indicators import compute_technical_indicators
+from quant_a.strategies import run_bollinger_strategy, run_ma_crossover_strategy
+from tests.test_price_store import make_prices
+
+
+class TestFeatureStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = FeatureStore(self.tmp.name)
+        self.prices = make_prices(n_days=400, tickers=("AAPL", "^GSPC"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_incremental_extension(self):
+        """Growing the price history only appends the new bars, with the same values."""
+        close = self.prices["AAPL"]
+        specs = [('sma', {'window': 20}), ('rolling_std', {'window': 20}), ('rsi', {'window': 14}),
+                 ('log_return', {}), ('hist_vol', {'window': 21}), ('return_vol', {'window': 5})]
+        self.assertEqual({name for name, _ in specs}, set(FEATURES))
+
+        for name, params in specs:
+            self.store.get("AAPL", close.iloc[:300], name, **params)
+            for end in (301, 350, 400):
+                served = self.store.get("AAPL", close.iloc[:end], name, **params)
+                np.testing.assert_allclose(served, compute_feature(close.iloc[:end], name, **params), rtol=1e-9)
+
+            # A shorter history is a pure slice of the stored column
+            served = self.store.get("AAPL", close.iloc[:350], name, **params)
+            np.testing.assert_allclose(served, compute_feature(close.iloc[:350], name, **params), rtol=1e-9)
+            self.assertIsInstance(served.values.base, np.memmap)
+
+            # A later window gets the same warm-up NaNs as an in-memory computation
+            served = self.store.get("AAPL", close.iloc[100:], name, **params)
+            np.testing.assert_allclose(served, compute_feature(close.iloc[100:], name, **params), rtol=1e-9)
+
+    def test_rebuild_on_inconsistent_history(self):
+        """A request that does not line up with the stored column is recomputed."""
+        close = self.prices["^GSPC"]
+        self.store.get("^GSPC", close.iloc[100:], 'sma', window=10)
+        served = self.store.get("^GSPC", close, 'sma', window=10)
+        pd.testing.assert_series_equal(served, compute_feature(close, 'sma', window=10), check_names=False)
+
+    def test_revised_prices(self):
+        """A revised close (forming bar or back-adjusted history) recomputes the affected bars."""
+        close = self.prices["AAPL"]
+        self.store.get("AAPL", close, 'sma', window=5)
+
+        revised = close.copy()
+        revised.iloc[-1] *= 1.10
+        served = self.store.get("AAPL", revised, 'sma', window=5)
+        np.testing.assert_allclose(served, compute_feature(revised, 'sma', window=5), rtol=1e-12)
+
+        revised.iloc[200] *= 0.95
+        served = self.store.get("AAPL", revised.iloc[:300], 'sma', window=5)
+        np.testing.assert_allclose(served, compute_feature(revised.iloc[:300], 'sma', window=5), rtol=1e-12)
+        served = self.store.get("AAPL", revised, 'sma', window=5)
+        np.testing.assert_allclose(served, compute_feature(revised, 'sma', window=5), rtol=1e-12)
+
+    def test_rebuild_keeps_served_series(self):
+        """Rewriting a column never truncates the file behind a Series already served."""
+        close = self.prices["AAPL"]
+        held = self.store.get("AAPL", close, 'sma', window=20)
+        expected = held.to_numpy().copy()
+
+        revised = close * 1.05
+        self.store.get("AAPL", revised, 'sma', window=20)
+        self.store.get("AAPL", close.iloc[:100], 'sma', window=20)
+        np.testing.assert_array_equal(held.to_numpy(), expected)
+
+    def test_result_independent_of_store_content(self):
+        """A backtest on a window gives the same result whether or not longer history was stored."""
+        asset = self.prices[["AAPL"]]
+        expected = run_ma_crossover_strategy(asset.iloc[200:], 20, 100)
+        self.store.get("AAPL", asset["AAPL"], 'sma', window=20)
+        self.store.get("AAPL", asset["AAPL"], 'sma', window=100)
+        pd.testing.assert_frame_equal(run_ma_crossover_strategy(asset.iloc[200:], 20, 100, store=self.store),
+                                      expected)
+
+    def test_calendars_kept_apart(self):
+        """The same ticker on two universe calendars is stored twice instead of rewritten on every call."""
+        close = self.prices["AAPL"]
+        holidays = close.drop(close.index[::15])
+        for series in (close, holidays):
+            self.store.get("AAPL", series.iloc[:300], 'sma', window=10)
+
+        folder = os.path.join(self.tmp.name, "AAPL")
+        files = {name: os.stat(os.path.join(folder, name)).st_ino for name in os.listdir(folder)}
+        for series in (close, holidays):
+            served = self.store.get("AAPL", series.iloc[:250], 'sma', window=10)
+            np.testing.assert_allclose(served, compute_feature(series.iloc[:250], 'sma', window=10))
+        self.assertEqual(len(files), 6)
+        self.assertEqual(files, {name: os.stat(os.path.join(folder, name)).st_ino for name in os.listdir(folder)})
+
+    def test_consumers_and_archive(self):
+        """Indicators and strategies give identical results with and without the store."""
+        pd.testing.assert_frame_equal(compute_technical_indicators(self.prices, "AAPL", self.store),
+                                      compute_technical_indicators(self.prices, "AAPL"))
+        asset = self.prices[["AAPL"]]
+        pd.testing.assert_frame_equal(run_bollinger_strategy(asset, 20, 2.0, store=self.store),
+                                      run_bollinger_strategy(asset, 20, 2.0))
+
+        archive = write_price_archive(self.prices.iloc[:250], os.path.join(self.tmp.name, "archive"))
+        archive.append(self.prices.iloc[250:])
+        self.store.update_from_archive(archive, [('sma', {'window': 50})])
+        np.testing.assert_allclose(self.store.get("^GSPC", self.prices["^GSPC"], 'sma', window=50),
+                                   compute_feature(self.prices["^GSPC"], 'sma', window=50))
+
+
+if __name__ == '__main__':
+    unittest.main()
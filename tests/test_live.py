@@ -0,0 +1,63 @@
+import unittest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from quant_b.live import LivePortfolio
+from quant_b.portfolio_manager import simulate_portfolio
+from tests.test_price_store import make_prices
+
+
+class TestLivePortfolio(unittest.TestCase):
+
+    def setUp(self):
+        self.prices = make_prices(n_days=300)
+        self.weights = [0.2, 0.5, 0.3]
+
+    def test_incremental_matches_batch(self):
+        """Bar-by-bar updates reproduce the full-history computation."""
+        live = LivePortfolio(self.prices.iloc[:200], self.weights)
+        for i in range(200, len(self.prices)):
+            live.update(self.prices.iloc[[i]])
+
+        expected = simulate_portfolio(self.prices, self.weights)
+        np.testing.assert_allclose(live.history["Cumulative"], expected["cumulative_returns"], rtol=1e-12)
+        for key, value in expected["metrics"].items():
+            self.assertAlmostEqual(live.metrics()[key], value, places=10)
+
+        returns = self.prices.pct_change().dropna()
+        np.testing.assert_allclose(live.covariance(), returns.cov(), rtol=1e-9)
+        np.testing.assert_allclose(live.correlation(), returns.corr(), rtol=1e-9)
+        self.assertAlmostEqual(live.metrics()["Rolling Volatility"],
+                               expected["daily_returns"].tail(21).std() * np.sqrt(252))
+
+    def test_forming_bar_revision(self):
+        """Re-polling the current bar replaces its contribution instead of double counting."""
+        live = LivePortfolio(self.prices.iloc[:299], self.weights)
+        provisional = self.prices.iloc[[-1]] * 1.01
+        self.assertEqual(len(live.update(provisional)), 1)
+        new_points = live.update(self.prices.iloc[[-1]])
+        self.assertEqual(len(new_points), 1)
+        self.assertEqual(len(live.history), len(self.prices) - 1)
+
+        reference = LivePortfolio(self.prices, self.weights)
+        self.assertAlmostEqual(live.metrics()["Total Return"], reference.metrics()["Total Return"])
+        np.testing.assert_allclose(live.covariance(), reference.covariance(), rtol=1e-12)
+        self.assertTrue(live.update(self.prices.iloc[-5:-1]).empty)
+
+    def test_empty_or_partial_poll(self):
+        """A poll without data (or without every asset) returns no points and keeps the state."""
+        live = LivePortfolio(self.prices.iloc[:250], self.weights)
+        before = live.metrics()
+        self.assertTrue(live.update(pd.DataFrame()).empty)
+        self.assertTrue(live.update(self.prices.iloc[250:251, :2]).empty)
+        self.assertEqual(live.metrics(), before)
+        self.assertEqual(len(live.update(self.prices.iloc[[250]])), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.metrics import compute_metrics, compute_metrics_from_equity, rolling_sharpe
+from quant_a.strategies import get_performance_metrics
+
+
+class TestMetricsEngine(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.returns = pd.DataFrame(rng.normal(0.0005, 0.01, size=(500, 4)), columns=list("ABCD"))
+
+    def test_columns_match_single_series(self):
+        """The 2D pass gives the same answer as scoring each column alone."""
+        batch = compute_metrics(self.returns)
+        for col in self.returns.columns:
+            single = compute_metrics(self.returns[col])
+            pd.testing.assert_series_equal(batch.loc[col], single.iloc[0], check_names=False)
+
+    def test_reference_values(self):
+        """Sharpe, volatility and drawdown follow the textbook definitions."""
+        r = self.returns["A"]
+        metrics = compute_metrics(r, risk_free_rate=0.01, periods_per_year=12).loc["A"]
+        wealth = np.concatenate(([1.0], (1 + r).cumprod()))
+        peak = np.maximum.accumulate(wealth)
+        self.assertAlmostEqual(metrics["Total Return"], wealth[-1] - 1)
+        self.assertAlmostEqual(metrics["Annual Volatility"], r.std() * np.sqrt(12))
+        self.assertAlmostEqual(metrics["Sharpe Ratio"], (r.mean() * 12 - 0.01) / (r.std() * np.sqrt(12)))
+        self.assertAlmostEqual(metrics["Max Drawdown"], ((wealth - peak) / peak).min())
+
+    def test_drawdown_duration(self):
+        """Duration counts the periods spent under water."""
+        r = pd.Series([0.1, -0.05, -0.05, 0.02, 0.2, -0.01])
+        metrics = compute_metrics(r).iloc[0]
+        self.assertEqual(metrics["Max Drawdown Duration"], 3)
+
+    def test_flat_series(self):
+        """Zero-volatility series score 0 rather than inf/NaN."""
+        metrics = compute_metrics(np.zeros((10, 2)), risk_free_rate=0.0).iloc[0]
+        self.assertEqual(metrics["Sharpe Ratio"], 0.0)
+        self.assertEqual(metrics["Sortino Ratio"], 0.0)
+        self.assertEqual(metrics["Calmar Ratio"], 0.0)
+
+    def test_equity_entry_points(self):
+        """Equity-curve helpers agree with the returns-based engine."""
+        equity = (1 + self.returns.fillna(0)).cumprod()
+        equity = pd.concat([pd.DataFrame([[1.0] * 4], columns=equity.columns), equity], ignore_index=True)
+        pd.testing.assert_frame_equal(compute_metrics_from_equity(equity), compute_metrics(self.returns))
+        single = get_performance_metrics(equity["B"])
+        self.assertAlmostEqual(single["Sharpe Ratio"], compute_metrics(self.returns["B"]).iloc[0]["Sharpe Ratio"])
+        self.assertEqual(rolling_sharpe(self.returns, window=20).shape, self.returns.shape)
+
+
+if __name__ == '__main__':
+    unittest.main()
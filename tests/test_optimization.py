@@ -0,0 +1,61 @@
+import unittest
+import sys
+import os
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from quant_b.optimization import (optimize_constrained, optimize_scenarios, get_min_variance_weights,
+                                  prepare_optimizer_inputs)
+from tests.test_price_store import make_prices
+
+
+class TestConstrainedOptimizer(unittest.TestCase):
+
+    def setUp(self):
+        self.prices = make_prices(n_days=500, tickers=("AAPL", "MSFT", "BTC-USD", "ETH-USD", "^GSPC"), seed=3)
+        self.assets = self.prices.columns.tolist()
+
+    def test_min_variance_matches_reference(self):
+        """Minimum variance matches the closed-form solution (all weights positive here)."""
+        result = optimize_constrained(self.prices, objective='min_variance')
+        inv = np.linalg.inv(self.prices.pct_change().dropna().cov().to_numpy())
+        reference = inv.sum(axis=1) / inv.sum()
+        np.testing.assert_allclose(list(result['weights'].values()), reference, atol=1e-6)
+        np.testing.assert_allclose(reference, get_min_variance_weights(self.prices.pct_change().dropna()), atol=5e-3)
+        self.assertTrue(result['success'])
+
+    def test_constraints_are_respected(self):
+        """Weight bounds, asset-class limits and the volatility target all bind."""
+        result = optimize_constrained(self.prices, objective='max_return', max_weight=0.4,
+                                      group_limits={'Crypto': (0.0, 0.15), 'Equity': (0.3, 1.0)},
+                                      target_volatility=0.14)
+        w = result['weights']
+        self.assertAlmostEqual(sum(w.values()), 1.0, places=8)
+        self.assertLessEqual(max(w.values()), 0.4 + 1e-8)
+        self.assertLessEqual(w['BTC-USD'] + w['ETH-USD'], 0.15 + 1e-8)
+        self.assertGreaterEqual(w['AAPL'] + w['MSFT'], 0.3 - 1e-8)
+        self.assertLessEqual(result['volatility'], 0.14 + 1e-6)
+
+    def test_turnover_penalty(self):
+        """A prohibitive turnover penalty keeps the current allocation."""
+        current = dict(zip(self.assets, [0.3, 0.3, 0.1, 0.1, 0.2]))
+        free = optimize_constrained(self.prices, current_weights=current)
+        sticky = optimize_constrained(self.prices, current_weights=current, turnover_penalty=10.0)
+        self.assertGreater(free['turnover'], 0.05)
+        self.assertLess(sticky['turnover'], 1e-6)
+
+    def test_batch_matches_single_solves(self):
+        """Batched (parallel) solves give the same answers as one-by-one calls."""
+        scenarios = [{'target_volatility': v} for v in (0.10, 0.15, 0.20)] + [{'objective': 'min_variance'}]
+        batch = optimize_scenarios(self.prices, scenarios, n_jobs=2, objective='max_return', max_weight=0.5)
+        for scenario, result in zip(scenarios, batch):
+            single = optimize_constrained(self.prices, **{'objective': 'max_return', 'max_weight': 0.5, **scenario})
+            np.testing.assert_allclose(list(result['weights'].values()), list(single['weights'].values()), atol=1e-8)
+        inputs = prepare_optimizer_inputs(self.prices)
+        np.testing.assert_allclose(inputs['chol'].dot(inputs['chol'].T), inputs['cov'], atol=1e-10)
+
+
+if __name__ == '__main__':
+    unittest.main()
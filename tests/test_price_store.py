@@ -0,0 +1,101 @@
+import unittest
+import sys
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.price_store import write_price_archive, PriceArchive
+from quant_a.strategies import (run_ma_crossover_strategy, run_bollinger_strategy,
+                                run_ma_crossover_out_of_core, run_bollinger_out_of_core)
+from quant_b.portfolio_manager import simulate_portfolio, simulate_portfolio_out_of_core
+
+
+def make_prices(n_days=900, tickers=("AAA", "BBB", "CCC"), seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2020-01-01", periods=n_days)
+    returns = rng.normal(0.0003, 0.015, size=(n_days, len(tickers)))
+    return pd.DataFrame(100 * np.cumprod(1 + returns, axis=0), index=index, columns=list(tickers))
+
+
+class TestPriceArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.prices = make_prices()
+        self.archive = write_price_archive(self.prices, self.tmp.name, freq="Q")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_roundtrip(self):
+        """Chunks concatenate back to the original frame."""
+        self.assertGreater(len(self.archive), 1)
+        pd.testing.assert_frame_equal(self.archive.load(), self.prices, check_freq=False)
+        subset = PriceArchive(self.tmp.name).load(tickers=["CCC"], start="2021-01-01", end="2021-06-30")
+        pd.testing.assert_frame_equal(subset, self.prices.loc["2021-01-01":"2021-06-30", ["CCC"]],
+                                      check_freq=False)
+
+    def test_append_merges_open_period(self):
+        """Appending bars extends the last chunk instead of duplicating the period."""
+        path = os.path.join(self.tmp.name, "incremental")
+        archive = write_price_archive(self.prices.iloc[:500], path, freq="Q")
+        n_chunks = len(archive)
+        archive.append(self.prices.iloc[500:])
+        self.assertEqual(len(archive), len(self.archive))
+        self.assertGreaterEqual(len(archive), n_chunks)
+        pd.testing.assert_frame_equal(PriceArchive(path).load(), self.prices, check_freq=False)
+        with self.assertRaises(ValueError):
+            archive.append(self.prices.iloc[:5])
+
+    def test_strategies_match_in_memory(self):
+        """Streaming strategies reproduce the in-memory backtests."""
+        asset = self.prices[["BBB"]]
+        cases = [
+            (run_ma_crossover_strategy(asset, 20, 100),
+             run_ma_crossover_out_of_core(self.archive.iter_chunks(["BBB"]), 20, 100)),
+            (run_bollinger_strategy(asset, 20, 2.0),
+             run_bollinger_out_of_core(self.archive.iter_chunks(["BBB"]), 20, 2.0)),
+        ]
+        for expected, stream in cases:
+            streamed = pd.concat(list(stream))
+            for col in ["Signal", "Strategy_Returns", "Cumulative_PNL", "Benchmark_PNL"]:
+                np.testing.assert_allclose(streamed[col], expected[col], rtol=1e-10)
+
+    def test_portfolio_matches_in_memory(self):
+        """Streaming portfolio simulation reproduces curves and metrics."""
+        weights = [0.5, 0.3, 0.2]
+        expected = simulate_portfolio(self.prices, weights)
+        streamed = simulate_portfolio_out_of_core(self.archive.iter_chunks(), weights)
+        np.testing.assert_allclose(streamed["cumulative_returns"], expected["cumulative_returns"], rtol=1e-12)
+        for key, value in expected["metrics"].items():
+            self.assertAlmostEqual(streamed["metrics"][key], value, places=10)
+
+    def test_mixed_calendar(self):
+        """On a union calendar (crypto trading every day), streaming skips the gaps like dropna()."""
+        crypto = make_prices(n_days=1300, tickers=("CRY",), seed=3)
+        crypto.index = pd.date_range("2020-01-01", periods=len(crypto), freq="D")
+        prices = self.prices.join(crypto, how="outer")
+        prices.loc[prices.index[::37], "AAA"] = np.nan
+        archive = write_price_archive(prices, os.path.join(self.tmp.name, "mixed"), freq="Q")
+
+        asset = archive.load(["BBB"]).dropna()
+        expected = run_ma_crossover_strategy(asset, 20, 100)
+        streamed = pd.concat(list(run_ma_crossover_out_of_core(archive.iter_chunks(["BBB"]), 20, 100)))
+        self.assertEqual(len(streamed), len(expected))
+        for col in ["Long_MA", "Signal", "Cumulative_PNL"]:
+            np.testing.assert_allclose(streamed[col], expected[col], rtol=1e-10)
+
+        weights = [0.4, 0.3, 0.2, 0.1]
+        expected = simulate_portfolio(archive.load().dropna(), weights)
+        streamed = simulate_portfolio_out_of_core(archive.iter_chunks(), weights)
+        np.testing.assert_allclose(streamed["cumulative_returns"], expected["cumulative_returns"], rtol=1e-12)
+        for key, value in expected["metrics"].items():
+            self.assertAlmostEqual(streamed["metrics"][key], value, places=10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+import sys
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from quant_b.stress import StressTester
+from utils.price_store import write_price_archive
+from tests.test_price_store import make_prices
+
+
+class TestStressTester(unittest.TestCase):
+
+    def setUp(self):
+        self.prices = make_prices(n_days=600, tickers=("AAA", "BBB", "CCC"), seed=5)
+        self.tester = StressTester(self.prices)
+        self.tester.add_historical("Window", "2020-06-01", "2020-08-31")
+
+    def test_historical_replay(self):
+        """Buy-and-hold P&L and drawdown over the window match a direct replay."""
+        weights = np.array([0.5, 0.2, 0.3])
+        report = self.tester.report(weights)
+
+        anchor = self.prices.loc[:"2020-05-31"].iloc[-1]
+        growth = self.prices.loc["2020-06-01":"2020-08-31"] / anchor
+        value = np.concatenate(([1.0], growth.to_numpy().dot(weights)))
+        peak = np.maximum.accumulate(value)
+        self.assertAlmostEqual(report.loc["Window", "P&L"], value[-1] - 1)
+        self.assertAlmostEqual(report.loc["Window", "Max Drawdown"], ((value - peak) / peak).min())
+
+    def test_batch_matches_single(self):
+        """Scoring thousands of portfolios at once equals scoring them one by one."""
+        self.tester.add_shock("Shock", {"AAA": -0.2})
+        weights = np.random.default_rng(0).random((2000, 3))
+        pnl, drawdown = self.tester.run(weights)
+        self.assertEqual(pnl.shape, (2000, 2))
+        for k in (0, 999, 1999):
+            single_pnl, single_dd = self.tester.run(weights[k])
+            np.testing.assert_allclose(pnl.iloc[k], single_pnl.iloc[0])
+            np.testing.assert_allclose(drawdown.iloc[k], single_dd.iloc[0])
+
+    def test_partial_window_rejected(self):
+        """A crisis window starting before the loaded history is skipped, not silently shortened."""
+        with self.assertRaises(ValueError):
+            self.tester.add_historical("Partial", "2019-12-01", "2020-02-28")
+        added = self.tester.add_available_historical({"Partial": ("2019-12-01", "2020-02-28"),
+                                                      "Covered": ("2020-03-02", "2020-03-20")})
+        self.assertEqual(added, ["Covered"])
+
+    def test_factor_shock_propagation(self):
+        """Unshocked assets move by their regression beta on the shocked factor."""
+        rng = np.random.default_rng(2)
+        market = rng.normal(0, 0.01, 2000)
+        returns = pd.DataFrame({"MKT": market, "HI": 1.5 * market + rng.normal(0, 0.002, 2000),
+                                "IND": rng.normal(0, 0.01, 2000)},
+                               index=pd.bdate_range("2015-01-01", periods=2000))
+        tester = StressTester((1 + returns).cumprod())
+        tester.add_shock("Crash", {"MKT": -0.10})
+        moves = tester.scenarios["Crash"][0] - 1
+        self.assertAlmostEqual(moves[0], -0.10)
+        self.assertAlmostEqual(moves[1], -0.15, delta=0.005)
+        self.assertAlmostEqual(moves[2], 0.0, delta=0.01)
+        self.assertAlmostEqual(tester.report([0, 1, 0]).loc["Crash", "Max Drawdown"], moves[1])
+
+    def test_archive_windows(self):
+        """Scenarios can be replayed straight from the on-disk archive."""
+        with tempfile.TemporaryDirectory() as tmp:
+            archive = write_price_archive(self.prices, tmp)
+            tester = StressTester.from_archive(archive, scenarios={"Window": ("2020-06-01", "2020-08-31"),
+                                                                   "Out of range": ("1990-01-01", "1990-12-31")})
+            self.assertEqual(list(tester.scenarios), ["Window"])
+            pd.testing.assert_frame_equal(tester.report([1, 1, 1]), self.tester.report([1, 1, 1]))
+
+            # Propagated shocks need a covariance window
+            with self.assertRaises(ValueError):
+                tester.add_shock("Shock", {"AAA": -0.2})
+            tester.add_shock("Raw shock", {"AAA": -0.2}, propagate=False)
+
+            start, end = self.prices.index[0], self.prices.index[-1]
+            tester = StressTester.from_archive(archive, scenarios={}, cov_start=start, cov_end=end)
+            tester.add_shock("Shock", {"AAA": -0.2})
+            self.tester.add_shock("Shock", {"AAA": -0.2})
+            np.testing.assert_allclose(tester.scenarios["Shock"], self.tester.scenarios["Shock"])
+
+
+if __name__ == '__main__':
+    unittest.main()
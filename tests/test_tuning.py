@@ -0,0 +1,55 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from quant_a.prediction import DEFAULT_PARAMS, load_tuned_params, get_ensemble_signals
+from quant_a.indicators import compute_technical_indicators
+from quant_a.tuning import tune_ensemble, _rung_budgets
+from tests.test_price_store import make_prices
+
+
+class TestEnsembleTuning(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.prices = make_prices(n_days=400, tickers=("AAPL", "MSFT"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_rung_budgets(self):
+        self.assertEqual(_rung_budgets(5, 3), [1, 2, 5])
+        self.assertEqual(_rung_budgets(9, 3), [1, 3, 9])
+
+    def test_successive_halving_persists_best(self):
+        """Pruned search fits fewer models than a full grid and persists the winner."""
+        result = tune_ensemble(self.prices, "AAPL", n_candidates=6, n_splits=3, n_jobs=2,
+                               random_state=1, path=self.tmp.name)
+        self.assertLess(result['n_fits'], 6 * 3)
+        self.assertLessEqual(result['cv_log_loss'], result['baseline_log_loss'] or float('inf'))
+
+        params = load_tuned_params("AAPL", path=self.tmp.name)
+        self.assertEqual(params, {**DEFAULT_PARAMS, **result['params']})
+        self.assertEqual(load_tuned_params("MSFT", path=self.tmp.name), DEFAULT_PARAMS)
+
+        prices, signals = get_ensemble_signals(self.prices, "AAPL", params=params)
+        self.assertEqual(len(prices), len(signals))
+
+    def test_tuning_excludes_test_segment(self):
+        """Parameters are tuned on the training split and ignored by backtests they have seen."""
+        result = tune_ensemble(self.prices, "AAPL", n_candidates=3, n_splits=2, n_jobs=1, path=self.tmp.name)
+        prices, _ = get_ensemble_signals(self.prices, "AAPL", params=DEFAULT_PARAMS)
+        self.assertLess(result['train_end'], prices.index[0].isoformat())
+
+        tuned = {**DEFAULT_PARAMS, **result['params']}
+        self.assertEqual(load_tuned_params("AAPL", path=self.tmp.name, before=prices.index[0]), tuned)
+        data = compute_technical_indicators(self.prices, "AAPL")
+        self.assertEqual(load_tuned_params("AAPL", path=self.tmp.name, before=data.index[100]), DEFAULT_PARAMS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import yfinance as yf
 import pandas as pd
 import streamlit as st
+from utils.price_store import PriceArchive, DEFAULT_ARCHIVE_PATH
 
 @st.cache_data(ttl=300)
 def get_data(tickers_input, period="1y"):
@@ -16,4 +17,42 @@ def get_data(tickers_input, period="1y"):
             df_close.columns = [tickers[0]]
         return df_close.dropna()
     except Exception:
-        return pd.DataFrame()
\ No newline at end of file
+        return pd.DataFrame()
+
+@st.cache_data(ttl=300)
+def get_archive_data(tickers_input, path=DEFAULT_ARCHIVE_PATH):
+    """
+    Full history of the requested tickers from the on-disk archive built by
+    scripts/build_price_archive.py, on the common calendar (like `get_data`).
+    Tickers missing from the archive are left out.
+    """
+    if not tickers_input:
+        return pd.DataFrame()
+    try:
+        archive = PriceArchive(path)
+        tickers = [t.strip().upper() for t in tickers_input.split(',')]
+        tickers = [t for t in tickers if t in archive.tickers]
+        if not tickers:
+            return pd.DataFrame()
+        return archive.load(tickers=tickers).dropna()
+    except Exception:
+        return pd.DataFrame()
+
+def get_latest_bars(tickers_input, period="5d", interval="1d"):
+    """
+    Lightweight, uncached poll of the most recent bars.
+    Used by the live monitor to append new data to its cached state.
+    """
+    if not tickers_input:
+        return pd.DataFrame()
+    try:
+        tickers = [t.strip().upper() for t in tickers_input.split(',')]
+        data = yf.download(tickers, period=period, interval=interval, auto_adjust=True, progress=False)
+        if data.empty:
+            return pd.DataFrame()
+        df_close = data['Close'].copy() if len(tickers) > 1 else data[['Close']].copy()
+        if len(tickers) == 1:
+            df_close.columns = [tickers[0]]
+        return df_close.dropna()
+    except Exception:
+        return pd.DataFrame()
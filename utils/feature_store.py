@@ -0,0 +1,211 @@
+import os
+from urllib.parse import quote
+import numpy as np
+import pandas as pd
+
+DEFAULT_FEATURE_PATH = os.path.join("data", "features")
+
+
+# --- FEATURE REGISTRY ---
+# Each feature maps a Close series to a Series of the same index, and declares how many
+# prior bars it needs so a stored column can be extended with only the new bars.
+
+def _sma(close, window):
+    return close.rolling(window=window).mean()
+
+def _rolling_std(close, window):
+    return close.rolling(window=window).std()
+
+def _rsi(close, window=14):
+    delta = close.diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
+    rs = gain / loss
+    return 100 - (100 / (1 + rs))
+
+def _log_return(close):
+    return np.log(close / close.shift(1))
+
+def _hist_vol(close, window=21, periods_per_year=252):
+    return _log_return(close).rolling(window=window).std() * np.sqrt(periods_per_year)
+
+def _return_vol(close, window):
+    return close.pct_change().rolling(window=window).std()
+
+FEATURES = {
+    'sma': (_sma, lambda window: window - 1),
+    'rolling_std': (_rolling_std, lambda window: window - 1),
+    'rsi': (_rsi, lambda window=14: window),
+    'log_return': (_log_return, lambda: 1),
+    'hist_vol': (_hist_vol, lambda window=21, periods_per_year=252: window),
+    'return_vol': (_return_vol, lambda window: window),
+}
+
+def compute_feature(close: pd.Series, feature: str, **params) -> pd.Series:
+    """Computes a registered feature in memory."""
+    if feature not in FEATURES:
+        raise ValueError(f"Unknown feature: {feature}")
+    return FEATURES[feature][0](close, **params)
+
+def load_feature(close: pd.Series, feature: str, store=None, ticker=None, **params) -> pd.Series:
+    """
+    Single entry point used by indicators, strategies and reports.
+    Served from the feature store when one is given (and the ticker is known),
+    computed in memory otherwise.
+    """
+    if store is not None and ticker is not None:
+        return store.get(ticker, close, feature, **params)
+    return compute_feature(close, feature, **params)
+
+
+class FeatureStore:
+    """
+    On-disk columnar store of technical features keyed by (ticker, feature, params)
+    and calendar: a ticker's close differs between universes with other holidays,
+    so each calendar seen for it gets its own column. Each column is a float64
+    values file, an int64 timestamp file and a float64 file of the input closes,
+    read back through memory maps: cached slices are served without copying, and
+    a longer price history only triggers computation of the new bars. The stored
+    closes detect revised prices, so only bars from the first changed close
+    onwards are recomputed. Results always equal `compute_feature(close)`.
+    """
+
+    def __init__(self, path: str = DEFAULT_FEATURE_PATH):
+        self.path = path
+
+    def _column_paths(self, ticker, feature, params, stamps):
+        """
+        Files of the column whose calendar matches `stamps`: identical timestamps
+        wherever the two overlap. A new calendar variant is allocated otherwise.
+        """
+        key = "__".join([feature] + [f"{k}={params[k]}" for k in sorted(params)])
+        folder = os.path.join(self.path, quote(str(ticker), safe=''))
+        variants = []
+        if os.path.isdir(folder):
+            prefix, suffix = f"{key}.cal", ".index.i64"
+            variants = sorted(int(name[len(prefix):-len(suffix)]) for name in os.listdir(folder)
+                              if name.startswith(prefix) and name.endswith(suffix)
+                              and name[len(prefix):-len(suffix)].isdigit())
+
+        def paths(variant):
+            return tuple(os.path.join(folder, f"{key}.cal{variant}.{part}")
+                         for part in ("values.f64", "index.i64", "close.f64"))
+
+        for variant in variants:
+            index = self._read(paths(variant)[1], np.int64)
+            if len(index) == 0:
+                continue
+            lo, hi = np.searchsorted(index, stamps[0]), np.searchsorted(index, stamps[-1], side='right')
+            a, b = np.searchsorted(stamps, index[0]), np.searchsorted(stamps, index[-1], side='right')
+            if b > a and np.array_equal(index[lo:hi], stamps[a:b]):
+                return paths(variant)
+        return paths(variants[-1] + 1 if variants else 0)
+
+    @staticmethod
+    def _read(path, dtype):
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode='r')
+
+    @staticmethod
+    def _write(paths, values, index, closes, append=False):
+        """
+        Appends to the column files, or rewrites them through a temporary file and
+        `os.replace`: Series already served keep mapping the previous file, which
+        is never truncated under them.
+        """
+        os.makedirs(os.path.dirname(paths[0]), exist_ok=True)
+        for path, data, dtype in zip(paths, (values, index, closes), (np.float64, np.int64, np.float64)):
+            target = path if append else f"{path}.tmp"
+            with open(target, 'ab' if append else 'wb') as f:
+                f.write(np.ascontiguousarray(data, dtype=dtype).tobytes())
+            if not append:
+                os.replace(target, path)
+
+    @staticmethod
+    def _n_equal(a, b):
+        """Length of the leading run where `a` and `b` agree (NaN equal to NaN)."""
+        same = (a == b) | (np.isnan(a) & np.isnan(b))
+        return len(same) if same.all() else int(np.argmin(same))
+
+    def get(self, ticker, close: pd.Series, feature: str, **params) -> pd.Series:
+        """
+        Returns the feature aligned on `close.index`, equal to `compute_feature(close)`.
+        Bars already stored with the same close are served from the memory-mapped
+        column (without copying when the request starts on its first bar). Newer bars,
+        bars whose close was revised and the last stored bar (which may still have been
+        forming) are recomputed from a short warm-up tail.
+        """
+        if close.empty:
+            return compute_feature(close, feature, **params)
+        stamps = close.index.as_unit("ns").asi8
+        paths = self._column_paths(ticker, feature, params, stamps)
+        lookback = FEATURES[feature][1](**params)
+        closes = close.to_numpy(dtype=np.float64)
+        stored_values = self._read(paths[0], np.float64)
+        stored_index = self._read(paths[1], np.int64)
+        stored_close = self._read(paths[2], np.float64)
+        n_stored = len(stored_index)
+
+        # Stored bars are reused while the request starts on a stored bar and both
+        # timestamps and closes line up; the last stored bar is always recomputed
+        start, valid = 0, 0
+        if n_stored and n_stored == len(stored_values) == len(stored_close):
+            start = np.searchsorted(stored_index, stamps[0])
+            if start < n_stored and stored_index[start] == stamps[0]:
+                overlap = min(n_stored - start, len(stamps))
+                if np.array_equal(stored_index[start:start + overlap], stamps[:overlap]):
+                    valid = self._n_equal(stored_close[start:start + overlap], closes[:overlap])
+                    if start + valid == n_stored:
+                        valid -= 1
+
+        if valid <= 0:
+            values = compute_feature(close, feature, **params).to_numpy(dtype=np.float64)
+            self._write(paths, values, stamps, closes)
+            start = 0
+        elif valid < len(stamps):
+            # Warm-up comes from the stored closes, which may precede the request
+            keep = start + valid
+            warmup = stored_close[max(0, keep - lookback):keep]
+            tail = pd.Series(np.concatenate([warmup, closes[valid:]]))
+            values = compute_feature(tail, feature, **params).to_numpy(dtype=np.float64)[len(warmup):]
+
+            # An unrevised last bar comes out unchanged: keep it and append the rest
+            same = n_stored - keep
+            if (same <= len(values)
+                    and self._n_equal(stored_values[keep:], values[:same]) == same
+                    and self._n_equal(stored_close[keep:], closes[valid:valid + same]) == same):
+                if same < len(values):
+                    self._write(paths, values[same:], stamps[valid + same:], closes[valid + same:], append=True)
+            else:
+                self._write(paths, np.concatenate([stored_values[:keep], values]),
+                            np.concatenate([stored_index[:keep], stamps[valid:]]),
+                            np.concatenate([stored_close[:keep], closes[valid:]]))
+
+        values = self._read(paths[0], np.float64)[start:start + len(stamps)]
+        if start > 0:
+            # The column was warmed up on earlier bars: the first `lookback` bars of the
+            # request are recomputed from its own closes, as the in-memory path would
+            head = compute_feature(close.iloc[:lookback], feature, **params).to_numpy(dtype=np.float64)
+            values = np.concatenate([head, values[len(head):]])
+        return pd.Series(values, index=close.index, name=feature, copy=False)
+
+    def update_from_archive(self, archive, specs, tickers=None):
+        """
+        Extends stored features after the price archive has grown, on each
+        ticker's own calendar. `specs` is a list of (feature, params) pairs.
+        """
+        for ticker in tickers or archive.tickers:
+            close = archive.load(tickers=[ticker])[ticker].dropna()
+            for feature, params in specs:
+                self.get(ticker, close, feature, **params)
+
+
+_DEFAULT_STORE = None
+
+def get_feature_store() -> FeatureStore:
+    """Process-wide store shared by the dashboard, the models and the daily report."""
+    global _DEFAULT_STORE
+    if _DEFAULT_STORE is None:
+        _DEFAULT_STORE = FeatureStore(DEFAULT_FEATURE_PATH)
+    return _DEFAULT_STORE
@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+
+# Using 2.0% as a standard institutional risk-free rate baseline
+RISK_FREE_RATE = 0.02
+TRADING_DAYS = 252
+
+
+def _as_frame(data) -> pd.DataFrame:
+    """Wraps a Series / 1D / 2D array as a (time x series) DataFrame."""
+    if isinstance(data, pd.DataFrame):
+        return data
+    if isinstance(data, pd.Series):
+        return data.to_frame()
+    array = np.asarray(data, dtype=np.float64)
+    return pd.DataFrame(array.reshape(len(array), -1))
+
+
+def _safe_ratio(numerator, denominator):
+    """Element-wise ratio returning 0.0 wherever the denominator is zero or undefined."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = numerator / denominator
+    return np.where((denominator > 0) & np.isfinite(denominator), ratio, 0.0)
+
+
+def compute_drawdowns(returns):
+    """
+    Builds the wealth path (base 1.0 before the first return) and its drawdown
+    for every column. Returns (wealth, drawdown) as (T+1 x N) arrays.
+    """
+    r = np.nan_to_num(_as_frame(returns).to_numpy(dtype=np.float64))
+    growth = np.vstack([np.ones((1, r.shape[1])), 1 + r])
+    wealth = np.cumprod(growth, axis=0)
+    peak = np.maximum.accumulate(wealth, axis=0)
+    return wealth, (wealth - peak) / peak
+
+
+def compute_metrics(returns, risk_free_rate: float = RISK_FREE_RATE,
+                    periods_per_year: int = TRADING_DAYS) -> pd.DataFrame:
+    """
+    Vectorized performance metrics for a (time x series) matrix of periodic returns.
+    Every metric is computed for all columns in one pass; NaNs (e.g. series with
+    different start dates) are ignored. Returns one row per series.
+    """
+    frame = _as_frame(returns)
+    r = frame.to_numpy(dtype=np.float64)
+    n_obs = np.sum(~np.isnan(r), axis=0)
+
+    wealth, drawdown = compute_drawdowns(r)
+    total_return = wealth[-1] - 1
+    max_drawdown = drawdown.min(axis=0)
+
+    # Longest stretch (in periods) spent below a previous peak
+    steps = np.arange(len(drawdown))[:, None]
+    last_peak = np.maximum.accumulate(np.where(drawdown == 0, steps, 0), axis=0)
+    max_dd_duration = (steps - last_peak).max(axis=0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.nanmean(r, axis=0)
+        variance = np.nanvar(r, axis=0, ddof=1)
+        downside = np.minimum(r - risk_free_rate / periods_per_year, 0)
+        downside_variance = np.nanmean(downside ** 2, axis=0)
+    hits = np.sum(r > 0, axis=0)
+
+    metrics = metrics_from_moments(n_obs, mean, variance, downside_variance, total_return,
+                                   max_drawdown, max_dd_duration, hits, risk_free_rate, periods_per_year)
+    return pd.DataFrame(metrics, index=frame.columns)
+
+
+def metrics_from_moments(n, mean, variance, downside_variance, total_return, max_drawdown,
+                         max_dd_duration, hits, risk_free_rate: float = RISK_FREE_RATE,
+                         periods_per_year: int = TRADING_DAYS) -> dict:
+    """
+    Annualized metrics from running moments: observation count, mean, sample variance,
+    mean squared downside deviation (below risk_free_rate / periods_per_year) and the
+    count of positive periods. Works on scalars or per-series arrays, so the vectorized,
+    out-of-core and live paths all share the same definitions.
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        annual_volatility = np.sqrt(variance) * np.sqrt(periods_per_year)
+        excess_return = mean * periods_per_year - risk_free_rate
+        downside_vol = np.sqrt(downside_variance) * np.sqrt(periods_per_year)
+        annual_return = (1 + total_return) ** (periods_per_year / np.asarray(n, dtype=np.float64)) - 1
+        hit_ratio = np.where(n > 0, hits / np.maximum(n, 1), 0.0)
+
+    metrics = {
+        "Total Return": total_return,
+        "Annual Return": annual_return,
+        "Annual Volatility": annual_volatility,
+        "Sharpe Ratio": _safe_ratio(excess_return, annual_volatility),
+        "Sortino Ratio": _safe_ratio(excess_return, downside_vol),
+        "Max Drawdown": max_drawdown,
+        "Calmar Ratio": _safe_ratio(annual_return, -max_drawdown),
+        "Max Drawdown Duration": max_dd_duration,
+        "Hit Ratio": hit_ratio
+    }
+    if np.ndim(mean) == 0:
+        return {key: np.asarray(value).item() for key, value in metrics.items()}
+    return metrics
+
+
+def compute_metrics_from_equity(equity, risk_free_rate: float = RISK_FREE_RATE,
+                                periods_per_year: int = TRADING_DAYS) -> pd.DataFrame:
+    """Same as `compute_metrics`, starting from (time x series) equity curves."""
+    frame = _as_frame(equity)
+    returns = frame.pct_change().iloc[1:]
+    return compute_metrics(returns, risk_free_rate, periods_per_year)
+
+
+def rolling_sharpe(returns, window: int = 63, risk_free_rate: float = RISK_FREE_RATE,
+                   periods_per_year: int = TRADING_DAYS) -> pd.DataFrame:
+    """Annualized rolling Sharpe ratio for every column."""
+    frame = _as_frame(returns)
+    rolling = frame.rolling(window=window)
+    annual_vol = rolling.std() * np.sqrt(periods_per_year)
+    excess_return = rolling.mean() * periods_per_year - risk_free_rate
+    return (excess_return / annual_vol).where(annual_vol > 0)
@@ -0,0 +1,139 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+
+MANIFEST_FILE = "manifest.json"
+DEFAULT_ARCHIVE_PATH = os.path.join("data", "archive")
+
+
+def _chunk_paths(path, name):
+    return (os.path.join(path, f"{name}.values.npy"),
+            os.path.join(path, f"{name}.index.npy"))
+
+
+def _write_chunk(path, name, chunk):
+    values_path, index_path = _chunk_paths(path, name)
+    # Column-major layout: selecting a few tickers reads contiguous blocks from disk
+    np.save(values_path, np.asfortranarray(chunk.to_numpy(dtype=np.float64)))
+    index = chunk.index
+    if index.tz is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+    np.save(index_path, index.to_numpy())
+    return {
+        "file": name,
+        "start": chunk.index[0].isoformat(),
+        "end": chunk.index[-1].isoformat(),
+        "rows": len(chunk)
+    }
+
+
+def write_price_archive(df: pd.DataFrame, path: str, freq: str = "Y") -> "PriceArchive":
+    """
+    Writes a (dates x tickers) price DataFrame as a date-chunked archive.
+    Each calendar period (`freq`, e.g. 'Y' for daily bars, 'M' for minute bars)
+    is stored as its own .npy file so it can be memory-mapped independently.
+    """
+    os.makedirs(path, exist_ok=True)
+    tz = str(df.index.tz) if df.index.tz is not None else None
+    manifest = {"tickers": [str(c) for c in df.columns], "freq": freq, "tz": tz, "chunks": []}
+    with open(os.path.join(path, MANIFEST_FILE), "w") as f:
+        json.dump(manifest, f)
+
+    archive = PriceArchive(path)
+    archive.append(df)
+    return archive
+
+
+class PriceArchive:
+    """
+    Memory-mapped, date-chunked price history living on disk.
+    Chunks are served one at a time so pipelines never hold the full
+    universe in RAM.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, MANIFEST_FILE)) as f:
+            self.manifest = json.load(f)
+        self.tickers = self.manifest["tickers"]
+        self.freq = self.manifest["freq"]
+        self.tz = self.manifest.get("tz")
+
+    @property
+    def chunks(self) -> list:
+        return self.manifest["chunks"]
+
+    def __len__(self):
+        return len(self.chunks)
+
+    def _save_manifest(self):
+        with open(os.path.join(self.path, MANIFEST_FILE), "w") as f:
+            json.dump(self.manifest, f)
+
+    def _read_chunk(self, entry, columns=None) -> pd.DataFrame:
+        values_path, index_path = _chunk_paths(self.path, entry["file"])
+        values = np.load(values_path, mmap_mode="r")
+        index = pd.DatetimeIndex(np.load(index_path))
+        if self.tz is not None:
+            index = index.tz_localize("UTC").tz_convert(self.tz)
+        tickers = self.tickers
+        if columns is not None:
+            positions = [self.tickers.index(t) for t in columns]
+            values = values[:, positions]
+            tickers = list(columns)
+        return pd.DataFrame(values, index=index, columns=tickers, copy=False)
+
+    def iter_chunks(self, tickers=None, start=None, end=None):
+        """
+        Yields one DataFrame per stored chunk, in chronological order.
+        Chunks entirely outside [start, end] are skipped without touching disk.
+        """
+        start = pd.Timestamp(start) if start is not None else None
+        end = pd.Timestamp(end) if end is not None else None
+
+        for entry in self.chunks:
+            if start is not None and pd.Timestamp(entry["end"]) < start:
+                continue
+            if end is not None and pd.Timestamp(entry["start"]) > end:
+                break
+            chunk = self._read_chunk(entry, tickers)
+            if start is not None or end is not None:
+                chunk = chunk.loc[start:end]
+            if not chunk.empty:
+                yield chunk
+
+    def load(self, tickers=None, start=None, end=None) -> pd.DataFrame:
+        """Materializes a slice of the archive in memory (small universes / short windows only)."""
+        chunks = list(self.iter_chunks(tickers, start, end))
+        if not chunks:
+            return pd.DataFrame(columns=tickers or self.tickers)
+        return pd.concat(chunks)
+
+    def append(self, df: pd.DataFrame):
+        """
+        Appends newer bars to the archive. Rows falling in the same period as the
+        last stored chunk are merged into it; later periods become new chunks.
+        """
+        if df.empty:
+            return
+        if [str(c) for c in df.columns] != self.tickers:
+            raise ValueError("Appended data must have the same tickers as the archive.")
+        df = df.sort_index()
+
+        if self.chunks:
+            last_end = pd.Timestamp(self.chunks[-1]["end"])
+            if df.index[0] <= last_end:
+                raise ValueError("Appended data must start after the last stored bar.")
+
+        periods = df.index.to_period(self.freq)
+        for period, chunk in df.groupby(periods, sort=True):
+            if self.chunks and pd.Timestamp(self.chunks[-1]["end"]).to_period(self.freq) == period:
+                last = self.chunks.pop()
+                chunk = pd.concat([self._read_chunk(last).copy(), chunk])
+                name = last["file"]
+            else:
+                name = f"chunk_{len(self.chunks):05d}"
+            self.chunks.append(_write_chunk(self.path, name, chunk))
+
+        self._save_manifest()